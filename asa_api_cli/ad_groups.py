@@ -39,18 +39,19 @@ AD_GROUP_COLUMN_LABELS = {
     "search_match": "Search Match",
 }
 
+# Ad groups requested per API call when listing
+AD_GROUP_PAGE_SIZE = 100
+
 
 def ad_group_to_dict(ad_group: object) -> dict[str, Any]:
     """Convert ad group to display dictionary."""
+    bid = ad_group.default_bid_amount  # type: ignore
     return {
         "id": ad_group.id,  # type: ignore
         "name": ad_group.name,  # type: ignore
         "status": enum_value(ad_group.status),  # type: ignore
         "serving_status": enum_value(ad_group.serving_status),  # type: ignore
-        "default_bid": format_money(
-            ad_group.default_bid_amount.amount,  # type: ignore
-            ad_group.default_bid_amount.currency,  # type: ignore
-        ),
+        "default_bid": format_money(bid.amount, bid.currency),
         "search_match": enum_value(ad_group.automated_keywords_opt_in),  # type: ignore
     }
 
@@ -82,23 +83,34 @@ def list_ad_groups(
 
     try:
         with client:
-            with spinner("Fetching ad groups..."):
-                if status:
-                    selector = Selector().where("status", "==", status.value).limit(limit)
-                    ad_groups = client.campaigns(campaign_id).ad_groups.find(selector)
-                else:
-                    ad_groups = client.campaigns(campaign_id).ad_groups.list(limit=limit)
+            resource = client.campaigns(campaign_id).ad_groups
+            data: list[dict[str, Any]] = []
+            total_results = 0
 
-            if not ad_groups.data:
+            # Fetch page by page, converting each page to display rows before the next
+            with spinner("Fetching ad groups..."):
+                while len(data) < limit:
+                    page_size = min(AD_GROUP_PAGE_SIZE, limit - len(data))
+                    if status:
+                        selector = Selector().where("status", "==", status.value).limit(page_size).offset(len(data))
+                        page = resource.find(selector)
+                    else:
+                        page = resource.list(limit=page_size, offset=len(data))
+
+                    total_results = page.total_results
+                    data.extend(ad_group_to_dict(ag) for ag in page)
+                    if not page.data or not page.has_more:
+                        break
+
+            if not data:
                 print_warning("No ad groups found")
                 return
 
-            data = [ad_group_to_dict(ag) for ag in ad_groups]
             output_data(
                 data,
                 AD_GROUP_COLUMNS,
                 format,
-                title=f"Ad Groups ({ad_groups.total_results} total)",
+                title=f"Ad Groups ({total_results} total)",
                 column_labels=AD_GROUP_COLUMN_LABELS,
             )
 
@@ -5,6 +5,7 @@ This module provides the `brand` command for creating brand protection campaigns
 
 from dataclasses import dataclass
 from decimal import Decimal
+from functools import partial
 from typing import Annotated, Any
 
 import typer
@@ -20,8 +21,15 @@ from asa_api_client.models import (
 )
 from rich.table import Table
 
-from asa_api_cli.optimize import CampaignNameParts, wait_for_resource
+from asa_api_cli.optimize import (
+    CREATE_RATE_LIMIT,
+    CampaignNameParts,
+    RateLimiter,
+    call_with_backoff,
+    wait_for_resource,
+)
 from asa_api_cli.utils import (
+    confirm_action,
     console,
     get_client,
     handle_api_error,
@@ -725,7 +733,7 @@ def create_brand_campaigns(
             console.print(f"[yellow]Total daily budget: {total_budget} {ref_currency}[/yellow]")
             console.print()
 
-            if not typer.confirm(f"Create {len(campaign_plans)} brand campaign(s)?", default=True):
+            if not confirm_action(f"Create {len(campaign_plans)} brand campaign(s)?", default=True):
                 print_info("Cancelled")
                 return
 
@@ -734,23 +742,30 @@ def create_brand_campaigns(
             created_ad_groups = 0
             created_keywords = 0
 
+            # Shared by every creation request so rate limits back off all of them together
+            limiter = RateLimiter(CREATE_RATE_LIMIT)
+
             for plan_idx, plan in enumerate(campaign_plans, 1):
                 console.print()
                 console.print(f"[dim][{plan_idx}/{len(campaign_plans)}][/dim] Creating {plan.name}...")
 
                 with spinner("Creating campaign..."):
-                    new_campaign = client.campaigns.create(
-                        CampaignCreate(
-                            name=plan.name,
-                            adam_id=plan.adam_id,
-                            countries_or_regions=[plan.country],
-                            daily_budget_amount=Money(
-                                amount=str(plan.daily_budget),
-                                currency=plan.currency,
+                    new_campaign = call_with_backoff(
+                        partial(
+                            client.campaigns.create,
+                            CampaignCreate(
+                                name=plan.name,
+                                adam_id=plan.adam_id,
+                                countries_or_regions=[plan.country],
+                                daily_budget_amount=Money(
+                                    amount=str(plan.daily_budget),
+                                    currency=plan.currency,
+                                ),
+                                supply_sources=[CampaignSupplySource.APPSTORE_SEARCH_RESULTS],
+                                status=CampaignStatus.PAUSED if paused else CampaignStatus.ENABLED,
                             ),
-                            supply_sources=[CampaignSupplySource.APPSTORE_SEARCH_RESULTS],
-                            status=CampaignStatus.PAUSED if paused else CampaignStatus.ENABLED,
-                        )
+                        ),
+                        limiter,
                     )
 
                 print_success(f"Created campaign (ID: {new_campaign.id})")
@@ -760,37 +775,35 @@ def create_brand_campaigns(
                 def get_campaign(cid: int = new_campaign.id) -> Any:
                     return client.campaigns.get(cid)
 
-                wait_for_resource(get_campaign, max_attempts=10, delay=0.5)
+                wait_for_resource(get_campaign)
+                campaign_res = client.campaigns(new_campaign.id)
 
                 # Create ad groups for each keyword
                 for keyword in plan.keywords:
                     ag_name = f"Exact - {keyword.title()}"[:200]
+                    bid = Money(amount=str(plan.default_bid), currency=plan.currency)
 
                     with spinner(f"  Creating: {ag_name}..."):
-                        new_ag = client.campaigns(new_campaign.id).ad_groups.create(
-                            AdGroupCreate(
-                                name=ag_name,
-                                default_bid_amount=Money(
-                                    amount=str(plan.default_bid),
-                                    currency=plan.currency,
+                        new_ag = call_with_backoff(
+                            partial(
+                                campaign_res.ad_groups.create,
+                                AdGroupCreate(
+                                    name=ag_name,
+                                    default_bid_amount=bid,
+                                    automated_keywords_opt_in=False,
                                 ),
-                                automated_keywords_opt_in=False,
-                            )
+                            ),
+                            limiter,
                         )
                         created_ad_groups += 1
 
                     # Create keyword (must use bulk endpoint)
-                    client.campaigns(new_campaign.id).ad_groups(new_ag.id).keywords.create_bulk(
-                        [
-                            KeywordCreate(
-                                text=keyword,
-                                match_type=KeywordMatchType.EXACT,
-                                bid_amount=Money(
-                                    amount=str(plan.default_bid),
-                                    currency=plan.currency,
-                                ),
-                            )
-                        ]
+                    call_with_backoff(
+                        partial(
+                            campaign_res.ad_groups(new_ag.id).keywords.create_bulk,
+                            [KeywordCreate(text=keyword, match_type=KeywordMatchType.EXACT, bid_amount=bid)],
+                        ),
+                        limiter,
                     )
                     created_keywords += 1
 
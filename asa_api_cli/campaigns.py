@@ -1,20 +1,28 @@
 """Campaign CLI commands."""
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, timedelta
-from typing import Annotated, Any
+from decimal import Decimal, InvalidOperation
+from typing import TYPE_CHECKING, Annotated, Any, TypeVar
 
 import typer
 from asa_api_client.exceptions import AppleSearchAdsError
-from asa_api_client.models import CampaignStatus, CampaignUpdate, Money, Selector
+from asa_api_client.models import Campaign, CampaignStatus, CampaignUpdate, Money, Selector
 
 from asa_api_cli.utils import (
     OutputFormat,
+    api_command,
+    cache_get,
+    cache_key,
+    cache_set,
     confirm_action,
     enum_value,
     format_money,
     get_client,
     handle_api_error,
     output_data,
+    print_info,
     print_json,
     print_result_panel,
     print_success,
@@ -22,8 +30,19 @@ from asa_api_cli.utils import (
     spinner,
 )
 
+if TYPE_CHECKING:
+    from asa_api_client import AppleSearchAdsClient
+
 app = typer.Typer(help="Manage campaigns")
 
+T = TypeVar("T")
+
+# Maximum concurrent requests for multi-campaign pause/enable/delete
+CAMPAIGN_WORKERS = 8
+
+# Seconds a cached 7-day spend map is reused by `campaigns list --with-spend`
+SPEND_CACHE_TTL = 300
+
 CAMPAIGN_COLUMNS = [
     "id",
     "name",
@@ -43,6 +62,22 @@ CAMPAIGN_COLUMNS_WITH_SPEND = [
     "countries",
 ]
 
+# API fields requested by `campaigns list`: the displayed columns plus the
+# fields the SDK's Campaign model requires in order to validate.
+CAMPAIGN_LIST_FIELDS = (
+    "id",
+    "orgId",
+    "name",
+    "adamId",
+    "status",
+    "servingStatus",
+    "displayStatus",
+    "dailyBudgetAmount",
+    "countriesOrRegions",
+    "supplySources",
+    "modificationTime",
+)
+
 CAMPAIGN_COLUMN_LABELS = {
     "id": "ID",
     "serving_status": "Serving",
@@ -51,22 +86,26 @@ CAMPAIGN_COLUMN_LABELS = {
 }
 
 
+# Rich markup for known status values; anything else is shown as-is
+_STATUS_COLORS = {
+    "ENABLED": "[green]ENABLED[/green]",
+    "PAUSED": "[yellow]PAUSED[/yellow]",
+}
+
+_SERVING_COLORS = {
+    "RUNNING": "[green]RUNNING[/green]",
+    "NOT_RUNNING": "[dim]NOT_RUNNING[/dim]",
+}
+
+
 def _colorize_status(status: str) -> str:
     """Add color to status values."""
-    if status == "ENABLED":
-        return "[green]ENABLED[/green]"
-    elif status == "PAUSED":
-        return "[yellow]PAUSED[/yellow]"
-    return status
+    return _STATUS_COLORS.get(status, status)
 
 
 def _colorize_serving(serving: str) -> str:
     """Add color to serving status values."""
-    if serving == "RUNNING":
-        return "[green]RUNNING[/green]"
-    elif serving == "NOT_RUNNING":
-        return "[dim]NOT_RUNNING[/dim]"
-    return serving
+    return _SERVING_COLORS.get(serving, serving)
 
 
 def campaign_to_dict(campaign: object, spend: str | None = None, colorize: bool = False) -> dict[str, Any]:
@@ -78,6 +117,12 @@ def campaign_to_dict(campaign: object, spend: str | None = None, colorize: bool
         status = _colorize_status(status)
         serving_status = _colorize_serving(serving_status)
 
+    countries = campaign.countries_or_regions  # type: ignore
+    if len(countries) > 3:
+        countries_str = ", ".join(countries[:3]) + "..."
+    else:
+        countries_str = ", ".join(countries)
+
     result = {
         "id": campaign.id,  # type: ignore
         "name": campaign.name,  # type: ignore
@@ -87,15 +132,45 @@ def campaign_to_dict(campaign: object, spend: str | None = None, colorize: bool
             campaign.daily_budget_amount.amount if campaign.daily_budget_amount else None,  # type: ignore
             campaign.daily_budget_amount.currency if campaign.daily_budget_amount else None,  # type: ignore
         ),
-        "countries": ", ".join(campaign.countries_or_regions[:3])  # type: ignore
-        + ("..." if len(campaign.countries_or_regions) > 3 else ""),  # type: ignore
+        "countries": countries_str,
     }
     if spend is not None:
         result["spend_7d"] = spend
     return result
 
 
+def _spend_by_campaign(
+    client: "AppleSearchAdsClient", start: date, end: date, use_cache: bool = True
+) -> dict[int, str]:
+    """Get formatted spend per campaign for a date range.
+
+    Args:
+        client: The API client.
+        start: Report start date.
+        end: Report end date.
+        use_cache: Reuse a map cached within the last SPEND_CACHE_TTL seconds.
+
+    Returns:
+        Mapping of campaign ID to a "<amount> <currency>" string.
+    """
+    key = cache_key(client.org_id, "spend_by_campaign", start, end)
+    if use_cache:
+        cached = cache_get("reports", key, ttl=SPEND_CACHE_TTL)
+        if cached is not None:
+            return {int(campaign_id): spend for campaign_id, spend in cached.items()}
+
+    report = client.reports.campaigns(start, end)
+    spend_by_campaign = {
+        md.campaign_id: " ".join((spend.amount, spend.currency))
+        for row in report.row or []
+        if (md := row.metadata) and md.campaign_id and (total := row.total) and (spend := total.local_spend)
+    }
+    cache_set("reports", key, spend_by_campaign)
+    return spend_by_campaign
+
+
 @app.command("list")
+@api_command
 def list_campaigns(
     status: Annotated[
         CampaignStatus | None,
@@ -109,6 +184,10 @@ def list_campaigns(
         bool,
         typer.Option("--with-spend", "-w", help="Include 7-day spend (slower - requires report API)"),
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Fetch fresh spend data instead of reusing a recent report"),
+    ] = False,
     limit: Annotated[
         int,
         typer.Option("--limit", "-l", help="Maximum number of results"),
@@ -127,75 +206,67 @@ def list_campaigns(
         asa campaigns list --all              # Show all campaigns
         asa campaigns list --status PAUSED    # Show only paused campaigns
         asa campaigns list --with-spend       # Include 7-day spend data
+        asa campaigns list -w --no-cache      # Refetch spend data
         asa campaigns list --format json
     """
     client = get_client()
 
-    try:
-        with client:
-            # Determine which status to filter by
-            filter_status = status
-            if filter_status is None and not all_campaigns:
-                filter_status = CampaignStatus.ENABLED
+    with client:
+        # Determine which status to filter by
+        filter_status = status
+        if filter_status is None and not all_campaigns:
+            filter_status = CampaignStatus.ENABLED
 
-            with spinner("Fetching campaigns..."):
-                if filter_status:
-                    selector = Selector().where("status", "==", filter_status.value).limit(limit)
-                    campaigns = client.campaigns.find(selector)
-                else:
-                    campaigns = client.campaigns.list(limit=limit)
-
-            if not campaigns.data:
-                print_warning("No campaigns found")
-                return
-
-            # Get spend data if requested
-            spend_by_campaign: dict[int, str] = {}
+        # The campaign list and the spend report are independent, so fetch them together
+        with spinner("Fetching campaigns..."), ThreadPoolExecutor(max_workers=2) as executor:
+            selector = Selector().select(*CAMPAIGN_LIST_FIELDS).limit(limit)
+            if filter_status:
+                selector = selector.where("status", "==", filter_status.value)
+            campaigns_future = executor.submit(client.campaigns.find, selector)
+
+            spend_future = None
             if with_spend:
-                with spinner("Fetching 7-day spend data..."):
-                    end = date.today()
-                    start = end - timedelta(days=7)
-                    report = client.reports.campaigns(start, end)
-
-                    for row in report.row or []:
-                        if row.metadata and row.metadata.campaign_id and row.total:
-                            spend = row.total.local_spend
-                            if spend:
-                                spend_by_campaign[row.metadata.campaign_id] = f"{spend.amount} {spend.currency}"
-
-            # Use colors for table output
-            use_colors = format == OutputFormat.TABLE
-
-            data = [
-                campaign_to_dict(
-                    c,
-                    spend=spend_by_campaign.get(c.id),
-                    colorize=use_colors,
-                )
-                for c in campaigns
-            ]
-
-            # Choose columns based on whether spend is included
-            columns = CAMPAIGN_COLUMNS_WITH_SPEND if with_spend else CAMPAIGN_COLUMNS
-
-            # Build title
-            status_label = filter_status.value if filter_status else "all"
-            title = f"Campaigns ({campaigns.total_results} {status_label})"
-
-            output_data(
-                data,
-                columns,
-                format,
-                title=title,
-                column_labels=CAMPAIGN_COLUMN_LABELS,
+                end = date.today()
+                start = end - timedelta(days=7)
+                spend_future = executor.submit(_spend_by_campaign, client, start, end, use_cache=not no_cache)
+
+            campaigns = campaigns_future.result()
+            spend_by_campaign = spend_future.result() if spend_future else {}
+
+        if not campaigns.data:
+            print_warning("No campaigns found")
+            return
+
+        # Use colors for table output
+        use_colors = format == OutputFormat.TABLE
+
+        data = (
+            campaign_to_dict(
+                c,
+                spend=spend_by_campaign.get(c.id),
+                colorize=use_colors,
             )
+            for c in campaigns
+        )
+
+        # Choose columns based on whether spend is included
+        columns = CAMPAIGN_COLUMNS_WITH_SPEND if with_spend else CAMPAIGN_COLUMNS
+
+        # Build title
+        status_label = filter_status.value if filter_status else "all"
+        title = f"Campaigns ({campaigns.total_results} {status_label})"
 
-    except AppleSearchAdsError as e:
-        handle_api_error(e)
-        raise typer.Exit(1) from None
+        output_data(
+            data,
+            columns,
+            format,
+            title=title,
+            column_labels=CAMPAIGN_COLUMN_LABELS,
+        )
 
 
 @app.command("get")
+@api_command
 def get_campaign(
     campaign_id: Annotated[int, typer.Argument(help="Campaign ID")],
     format: Annotated[
@@ -211,73 +282,123 @@ def get_campaign(
     """
     client = get_client()
 
+    with client:
+        with spinner("Fetching campaign..."):
+            campaign = client.campaigns.get(campaign_id)
+
+        if format == OutputFormat.JSON:
+            print_json(campaign, title=f"Campaign {campaign_id}")
+        else:
+            data = [campaign_to_dict(campaign)]
+            output_data(data, CAMPAIGN_COLUMNS, format, column_labels=CAMPAIGN_COLUMN_LABELS)
+
+
+def _budget_differs(current: Money | None, amount: float, currency: str) -> bool:
+    """Check whether a requested budget differs from the campaign's current one.
+
+    Args:
+        current: The campaign's current budget, if any.
+        amount: The requested amount.
+        currency: The requested currency code.
+
+    Returns:
+        True if the budget needs to be updated.
+    """
+    if current is None or current.currency != currency:
+        return True
     try:
-        with client:
-            with spinner("Fetching campaign..."):
-                campaign = client.campaigns.get(campaign_id)
+        return Decimal(current.amount) != Decimal(str(amount))
+    except InvalidOperation:
+        return True
 
-            if format == OutputFormat.JSON:
-                print_json(campaign, title=f"Campaign {campaign_id}")
-            else:
-                data = [campaign_to_dict(campaign)]
-                output_data(data, CAMPAIGN_COLUMNS, format, column_labels=CAMPAIGN_COLUMN_LABELS)
 
-    except AppleSearchAdsError as e:
-        handle_api_error(e)
-        raise typer.Exit(1) from None
+def _for_each_campaign(
+    campaign_ids: list[int],
+    action: Callable[[int], T],
+    on_success: Callable[[int, T], None],
+) -> bool:
+    """Run an API call for several campaigns concurrently.
+
+    Results are handled as they complete; API errors are reported per
+    campaign without stopping the remaining calls.
+
+    Args:
+        campaign_ids: Campaigns to run the action for.
+        action: Function taking a campaign ID and performing the API call.
+        on_success: Called with the campaign ID and result of each successful call.
+
+    Returns:
+        True if every call succeeded.
+    """
+    all_ok = True
+    with ThreadPoolExecutor(max_workers=min(CAMPAIGN_WORKERS, len(campaign_ids))) as executor:
+        futures = {executor.submit(action, campaign_id): campaign_id for campaign_id in campaign_ids}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except AppleSearchAdsError as e:
+                handle_api_error(e)
+                all_ok = False
+                continue
+            on_success(futures[future], result)
+    return all_ok
+
+
+def _set_status(campaign_ids: list[int], status: CampaignStatus, verb: str) -> None:
+    """Update the status of one or more campaigns.
+
+    Args:
+        campaign_ids: Campaigns to update.
+        status: The new status.
+        verb: Past-tense verb for the success message (e.g. "paused").
+
+    Raises:
+        typer.Exit: If any update failed.
+    """
+    client = get_client()
+    update = CampaignUpdate(status=status)
+
+    with client, spinner(f"Updating {len(campaign_ids)} campaign(s)..."):
+        all_ok = _for_each_campaign(
+            campaign_ids,
+            lambda campaign_id: client.campaigns.update(campaign_id, data=update),
+            lambda _, campaign: print_success(f"Campaign '{campaign.name}' {verb}"),
+        )
+
+    if not all_ok:
+        raise typer.Exit(1)
 
 
 @app.command("pause")
+@api_command
 def pause_campaign(
-    campaign_id: Annotated[int, typer.Argument(help="Campaign ID to pause")],
+    campaign_ids: Annotated[list[int], typer.Argument(help="Campaign ID(s) to pause")],
 ) -> None:
-    """Pause a campaign.
+    """Pause one or more campaigns.
 
     Examples:
         asa campaigns pause 123456789
+        asa campaigns pause 123456789 987654321
     """
-    client = get_client()
-
-    try:
-        with client:
-            with spinner("Pausing campaign..."):
-                campaign = client.campaigns.update(
-                    campaign_id,
-                    data=CampaignUpdate(status=CampaignStatus.PAUSED),
-                )
-            print_success(f"Campaign '{campaign.name}' paused")
-
-    except AppleSearchAdsError as e:
-        handle_api_error(e)
-        raise typer.Exit(1) from None
+    _set_status(campaign_ids, CampaignStatus.PAUSED, "paused")
 
 
 @app.command("enable")
+@api_command
 def enable_campaign(
-    campaign_id: Annotated[int, typer.Argument(help="Campaign ID to enable")],
+    campaign_ids: Annotated[list[int], typer.Argument(help="Campaign ID(s) to enable")],
 ) -> None:
-    """Enable a paused campaign.
+    """Enable one or more paused campaigns.
 
     Examples:
         asa campaigns enable 123456789
+        asa campaigns enable 123456789 987654321
     """
-    client = get_client()
-
-    try:
-        with client:
-            with spinner("Enabling campaign..."):
-                campaign = client.campaigns.update(
-                    campaign_id,
-                    data=CampaignUpdate(status=CampaignStatus.ENABLED),
-                )
-            print_success(f"Campaign '{campaign.name}' enabled")
-
-    except AppleSearchAdsError as e:
-        handle_api_error(e)
-        raise typer.Exit(1) from None
+    _set_status(campaign_ids, CampaignStatus.ENABLED, "enabled")
 
 
 @app.command("set-budget")
+@api_command
 def set_budget(
     campaign_id: Annotated[int, typer.Argument(help="Campaign ID")],
     daily_budget: Annotated[
@@ -306,66 +427,86 @@ def set_budget(
 
     client = get_client()
 
-    try:
-        with client:
-            update = CampaignUpdate()
-            if daily_budget is not None:
-                update.daily_budget_amount = Money(amount=str(daily_budget), currency=currency)
-            if total_budget is not None:
-                update.budget_amount = Money(amount=str(total_budget), currency=currency)
+    with client:
+        with spinner("Fetching campaign..."):
+            campaign = client.campaigns.get(campaign_id)
+
+        # Only send the budgets that actually change
+        update = CampaignUpdate()
+        if daily_budget is not None and _budget_differs(campaign.daily_budget_amount, daily_budget, currency):
+            update.daily_budget_amount = Money(amount=str(daily_budget), currency=currency)
+        if total_budget is not None and _budget_differs(campaign.budget_amount, total_budget, currency):
+            update.budget_amount = Money(amount=str(total_budget), currency=currency)
 
-            with spinner("Updating budget..."):
-                campaign = client.campaigns.update(campaign_id, data=update)
+        if update.daily_budget_amount is None and update.budget_amount is None:
+            print_info(f"Campaign '{campaign.name}' already has this budget, nothing to update")
+            return
 
-            result_data = {"Campaign": campaign.name}
-            if campaign.daily_budget_amount:
-                amt = campaign.daily_budget_amount
-                result_data["Daily Budget"] = f"{amt.amount} {amt.currency}"
-            if campaign.budget_amount:
-                amt = campaign.budget_amount
-                result_data["Total Budget"] = f"{amt.amount} {amt.currency}"
+        with spinner("Updating budget..."):
+            campaign = client.campaigns.update(campaign_id, data=update)
 
-            print_result_panel("Budget Updated", result_data)
+        result_data = {"Campaign": campaign.name}
+        if campaign.daily_budget_amount:
+            amt = campaign.daily_budget_amount
+            result_data["Daily Budget"] = f"{amt.amount} {amt.currency}"
+        if campaign.budget_amount:
+            amt = campaign.budget_amount
+            result_data["Total Budget"] = f"{amt.amount} {amt.currency}"
 
-    except AppleSearchAdsError as e:
-        handle_api_error(e)
-        raise typer.Exit(1) from None
+        print_result_panel("Budget Updated", result_data)
 
 
 @app.command("delete")
+@api_command
 def delete_campaign(
-    campaign_id: Annotated[int, typer.Argument(help="Campaign ID to delete")],
+    campaign_ids: Annotated[list[int], typer.Argument(help="Campaign ID(s) to delete")],
     force: Annotated[
         bool,
         typer.Option("--force", "-f", help="Skip confirmation"),
     ] = False,
 ) -> None:
-    """Delete a campaign.
+    """Delete one or more campaigns.
 
     WARNING: This action cannot be undone.
 
     Examples:
         asa campaigns delete 123456789
-        asa campaigns delete 123456789 --force
+        asa campaigns delete 123456789 987654321 --force
     """
     client = get_client()
 
-    try:
-        with client:
-            # Get campaign name for confirmation
-            with spinner("Fetching campaign..."):
-                campaign = client.campaigns.get(campaign_id)
+    with client:
+        labels = {campaign_id: f"Campaign {campaign_id}" for campaign_id in campaign_ids}
+
+        # Only fetch campaign names when we need them for confirmation
+        if not force:
+            names: dict[int, str] = {}
 
-            if not force:
-                if not confirm_action(f"Are you sure you want to delete campaign '{campaign.name}'?"):
-                    print_warning("Cancelled")
-                    raise typer.Exit(0)
+            def remember_name(campaign_id: int, campaign: Campaign) -> None:
+                names[campaign_id] = campaign.name
 
-            with spinner("Deleting campaign..."):
-                client.campaigns.delete(campaign_id)
+            with spinner("Fetching campaigns..."):
+                all_ok = _for_each_campaign(campaign_ids, client.campaigns.get, remember_name)
+            if not all_ok:
+                raise typer.Exit(1)
 
-            print_success(f"Campaign '{campaign.name}' deleted")
+            labels = {campaign_id: f"Campaign '{names[campaign_id]}'" for campaign_id in campaign_ids}
+            if len(campaign_ids) == 1:
+                prompt = f"Are you sure you want to delete campaign '{names[campaign_ids[0]]}'?"
+            else:
+                listing = ", ".join(f"'{names[campaign_id]}'" for campaign_id in campaign_ids)
+                prompt = f"Are you sure you want to delete {len(campaign_ids)} campaigns ({listing})?"
+
+            if not confirm_action(prompt):
+                print_warning("Cancelled")
+                raise typer.Exit(0)
+
+        with spinner(f"Deleting {len(campaign_ids)} campaign(s)..."):
+            all_ok = _for_each_campaign(
+                campaign_ids,
+                client.campaigns.delete,
+                lambda campaign_id, _: print_success(f"{labels[campaign_id]} deleted"),
+            )
 
-    except AppleSearchAdsError as e:
-        handle_api_error(e)
-        raise typer.Exit(1) from None
+    if not all_ok:
+        raise typer.Exit(1)
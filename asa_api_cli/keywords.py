@@ -109,7 +109,7 @@ def list_keywords(
                 print_warning("No keywords found")
                 return
 
-            data = [keyword_to_dict(k) for k in keywords]
+            data = (keyword_to_dict(k) for k in keywords)
             output_data(
                 data,
                 KEYWORD_COLUMNS,
@@ -396,7 +396,7 @@ def list_negatives(
                 print_warning(f"No {level.lower()} negative keywords found")
                 return
 
-            data = [
+            data = (
                 {
                     "id": n.id,
                     "text": n.text,
@@ -404,7 +404,7 @@ def list_negatives(
                     "status": n.status.value,
                 }
                 for n in negatives
-            ]
+            )
             output_data(
                 data,
                 NEGATIVE_KEYWORD_COLUMNS,
@@ -1,48 +1,62 @@
 """Main CLI application."""
 
-from typing import Annotated
+import importlib
+from typing import Annotated, Any
 
 import typer
-from rich.console import Console
-
-from asa_api_cli import (
-    ad_groups,
-    auth,
-    brand,
-    campaigns,
-    impression_share,
-    keywords,
-    optimize,
-    reports,
-)
+from typer.core import TyperGroup
+
+# Sub-commands: name -> (module, help). Modules are imported on first use so
+# that `asa --version` or `asa auth test` don't pay for every command's imports.
+SUBCOMMANDS: dict[str, tuple[str, str]] = {
+    "auth": ("asa_api_cli.auth", "Authentication commands"),
+    "brand": ("asa_api_cli.brand", "Create brand protection campaigns"),
+    "campaigns": ("asa_api_cli.campaigns", "Manage campaigns"),
+    "ad-groups": ("asa_api_cli.ad_groups", "Manage ad groups"),
+    "keywords": ("asa_api_cli.keywords", "Manage keywords"),
+    "reports": ("asa_api_cli.reports", "Generate reports"),
+    "optimize": ("asa_api_cli.optimize", "Optimization tools"),
+    "impression-share": ("asa_api_cli.impression_share", "Impression share analysis"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Top-level group that imports sub-command modules on demand."""
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        """List eagerly registered commands followed by the lazy sub-commands."""
+        return [*super().list_commands(ctx), *(name for name in SUBCOMMANDS if name not in self.commands)]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        """Return a sub-command, importing its module the first time it is needed."""
+        if cmd_name not in self.commands and cmd_name in SUBCOMMANDS:
+            module_name, help_text = SUBCOMMANDS[cmd_name]
+            module = importlib.import_module(module_name)
+            # get_group, like add_typer, builds a sub-group without the top-level completion options
+            command = typer.main.get_group(module.app)
+            command.name = cmd_name
+            command.help = help_text
+            self.commands[cmd_name] = command
+        return super().get_command(ctx, cmd_name)
+
 
 app = typer.Typer(
     name="asa",
     help="Apple Search Ads API CLI - Manage campaigns, ad groups, keywords, and reports.",
     rich_markup_mode="rich",
+    cls=LazyGroup,
 )
 
-console = Console()
-
-# Register sub-commands
-app.add_typer(auth.app, name="auth", help="Authentication commands")
-app.add_typer(brand.app, name="brand", help="Create brand protection campaigns")
-app.add_typer(campaigns.app, name="campaigns", help="Manage campaigns")
-app.add_typer(ad_groups.app, name="ad-groups", help="Manage ad groups")
-app.add_typer(keywords.app, name="keywords", help="Manage keywords")
-app.add_typer(reports.app, name="reports", help="Generate reports")
-app.add_typer(optimize.app, name="optimize", help="Optimization tools")
-app.add_typer(impression_share.app, name="impression-share", help="Impression share analysis")
-
 
 def version_callback(value: bool) -> None:
     """Show version and exit."""
     if value:
         from asa_api_client import __version__ as api_version
+        from rich.console import Console
 
         from asa_api_cli import __version__ as cli_version
 
-        console.print(f"asa-api-cli {cli_version} (asa-api-client {api_version})")
+        Console().print(f"asa-api-cli {cli_version} (asa-api-client {api_version})")
         raise typer.Exit()
 
 
@@ -78,7 +92,9 @@ def main(
         asa auth test
     """
     if ctx.invoked_subcommand is None and not version:
-        console.print(ctx.get_help())
+        from rich.console import Console
+
+        Console().print(ctx.get_help())
         raise typer.Exit()
 
 
@@ -1,18 +1,33 @@
 """Optimization CLI commands for campaign management."""
 
+import csv
+import heapq
+import random
+import re
+import threading
 import time
-from collections import defaultdict
-from collections.abc import Callable
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from datetime import date, timedelta
-from decimal import Decimal
-from typing import Annotated, Any, TypeVar
+from decimal import Decimal, InvalidOperation
+from functools import cached_property, lru_cache, partial
+from itertools import batched
+from operator import attrgetter
+from typing import TYPE_CHECKING, Annotated, Any, TypeVar
+
+if TYPE_CHECKING:
+    from asa_api_client import AppleSearchAdsClient
 
 import typer
-from asa_api_client.exceptions import AppleSearchAdsError, NotFoundError
+from asa_api_client.exceptions import AppleSearchAdsError, NotFoundError, RateLimitError
 from asa_api_client.models import (
+    AdGroup,
     AdGroupCreate,
     AdGroupUpdate,
+    Campaign,
     CampaignCreate,
     CampaignStatus,
     CampaignSupplySource,
@@ -22,13 +37,23 @@ from asa_api_client.models import (
     KeywordUpdate,
     Money,
     NegativeKeywordCreate,
+    ReportingResponse,
     Selector,
 )
+from rich.console import Group
+from rich.markup import escape
 from rich.table import Table
 
 from asa_api_cli.utils import (
+    cache_get,
+    cache_key,
+    cache_set,
+    cached_report,
+    confirm_action,
     console,
+    create_progress,
     enum_value,
+    forget_report,
     get_client,
     handle_api_error,
     print_error,
@@ -43,18 +68,61 @@ app = typer.Typer(help="Optimization commands for campaigns")
 
 T = TypeVar("T")
 
+# Maximum concurrent report requests when fetching data for several campaigns
+REPORT_WORKERS = 8
+
+# Maximum concurrent ad group listings and keyword reports when scanning campaigns
+SCAN_WORKERS = 16
+
+# Days of keyword report data bid-check reads current keyword bids from
+BID_CHECK_DAYS = 30
+
+# Default concurrent ad group creations when building a campaign
+CREATE_WORKERS = 8
+
+# Maximum negative keywords sent in a single bulk request
+NEGATIVE_BATCH_SIZE = 1000
+
+# Maximum API requests per second across all creation workers
+CREATE_RATE_LIMIT = 10.0
+
+# expand --concurrency values above this are likely to just hit rate limits
+MAX_SUGGESTED_CONCURRENCY = 16
+
+# Ad groups listed when previewing an expand plan
+PLAN_PREVIEW_ROWS = 20
+
+# Default concurrent ad group bid updates for bid-check --auto-fix
+UPDATE_WORKERS = 8
+
+# Maximum API requests per second across all bid update workers
+UPDATE_RATE_LIMIT = 10.0
+
 
 def wait_for_resource(
     check_fn: Callable[[], T],
     max_attempts: int = 10,
-    delay: float = 0.5,
+    initial_delay: float = 0.1,
+    max_delay: float = 2.0,
+    multiplier: float = 2.0,
+    jitter: float = 0.2,
 ) -> T:
     """Wait for a resource to become available by polling.
 
+    The first check happens immediately and returns as soon as it succeeds;
+    only misses sleep. The delay grows by ``multiplier`` after each miss
+    (capped at ``max_delay``) and is randomized by up to ``jitter`` of its
+    value either way, so slow backends are polled less aggressively and
+    concurrent pollers don't line up. Rate limits are not retried here: the
+    client has already retried them by the time RateLimitError is raised.
+
     Args:
         check_fn: Function that returns the resource or raises NotFoundError.
         max_attempts: Maximum number of attempts before giving up.
-        delay: Delay in seconds between attempts.
+        initial_delay: Delay in seconds after the first miss.
+        max_delay: Maximum delay in seconds between attempts.
+        multiplier: Factor the delay grows by after each miss.
+        jitter: Maximum random adjustment, as a fraction of the delay.
 
     Returns:
         The resource once available.
@@ -66,14 +134,71 @@ def wait_for_resource(
         try:
             return check_fn()
         except NotFoundError:
-            if attempt < max_attempts - 1:
-                time.sleep(delay)
-            else:
+            if attempt == max_attempts - 1:
                 raise
+        sleep = min(max_delay, initial_delay * multiplier**attempt)
+        time.sleep(sleep * (1 + random.uniform(-jitter, jitter)))
     # Should never reach here, but satisfy type checker
     raise NotFoundError("Resource not found after maximum attempts")
 
 
+class RateLimiter:
+    """Thread-safe limiter shared by concurrent API workers.
+
+    Spaces calls to at most ``rate`` per second. When any worker is rate
+    limited, `pause` pushes the next slot back for every worker, so they back
+    off together instead of each thread hammering the API independently.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until the caller may issue its next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        time.sleep(max(0.0, slot - now))
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all workers for at least the given number of seconds."""
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+
+# Seconds all workers hold off after a request runs out of the client's own 429 retries
+RATE_LIMIT_COOLDOWN = 10.0
+
+
+def call_with_backoff(fn: Callable[[], T], limiter: RateLimiter) -> T:
+    """Call an API function through a shared rate limiter.
+
+    The client already retries rate-limited requests with its own backoff, so
+    this doesn't retry again. A request that is still rate limited after those
+    retries pauses every worker sharing ``limiter`` before the error is
+    re-raised, so the others back off instead of piling on more requests.
+
+    Args:
+        fn: Function performing a single API request.
+        limiter: Limiter shared by all workers making related requests.
+
+    Returns:
+        The function's result.
+
+    Raises:
+        RateLimitError: If the client's retries were exhausted.
+    """
+    limiter.wait()
+    try:
+        return fn()
+    except RateLimitError as e:
+        limiter.pause(e.retry_after or RATE_LIMIT_COOLDOWN)
+        raise
+
+
 @dataclass
 class BidDiscrepancy:
     """Represents a bid discrepancy between ad group and keywords."""
@@ -88,18 +213,267 @@ class BidDiscrepancy:
     keyword_max_bid: Decimal
     keyword_count: int
     currency: str
-
-    @property
-    def difference_pct(self) -> float:
-        """Percentage difference between keyword avg and ad group bid."""
+    difference_pct: float = field(init=False)  # Percentage difference between keyword avg and ad group bid
+    suggested_bid: Decimal = field(init=False)  # Keyword average rounded to cents
+    # Display strings, formatted once for the summary table and the detail view
+    ad_group_bid_str: str = field(init=False)
+    keyword_avg_bid_str: str = field(init=False)
+    keyword_min_bid_str: str = field(init=False)
+    keyword_max_bid_str: str = field(init=False)
+    suggested_bid_str: str = field(init=False)
+
+    def __post_init__(self) -> None:
         if self.ad_group_bid == 0:
-            return 0.0
-        return float((self.keyword_avg_bid - self.ad_group_bid) / self.ad_group_bid * 100)
+            self.difference_pct = 0.0
+        else:
+            self.difference_pct = float((self.keyword_avg_bid - self.ad_group_bid) / self.ad_group_bid * 100)
+        self.suggested_bid = round(self.keyword_avg_bid, 2)
+        self.ad_group_bid_str = _format_bid(self.ad_group_bid, self.currency)
+        self.keyword_avg_bid_str = _format_bid(self.keyword_avg_bid, self.currency)
+        self.keyword_min_bid_str = _format_bid(self.keyword_min_bid, self.currency)
+        self.keyword_max_bid_str = _format_bid(self.keyword_max_bid, self.currency)
+        self.suggested_bid_str = _format_bid(self.suggested_bid, self.currency)
+
+    @cached_property
+    def display_row(self) -> tuple[str, str, str, str, str, str]:
+        """Formatted cells for the discrepancy summary table."""
+        return (
+            self.campaign_name[:25] + ("..." if len(self.campaign_name) > 25 else ""),
+            self.ad_group_name[:20] + ("..." if len(self.ad_group_name) > 20 else ""),
+            self.ad_group_bid_str,
+            self.keyword_avg_bid_str,
+            f"+{self.difference_pct:.0f}%",
+            str(self.keyword_count),
+        )
+
+
+# Quantum for formatting bids to two decimal places
+_CENT = Decimal("0.01")
 
 
 def _format_bid(amount: Decimal, currency: str) -> str:
     """Format a bid amount with currency."""
-    return f"{amount:.2f} {currency}"
+    # Most bids already have two decimal places and can skip rounding
+    if amount.as_tuple().exponent != -2:
+        amount = amount.quantize(_CENT)
+    return f"{amount} {currency}"
+
+
+# How long cached campaign listings stay valid, in seconds
+CAMPAIGN_CACHE_TTL = 300
+
+# Campaigns requested per page when listing campaigns
+CAMPAIGN_PAGE_SIZE = 1000
+
+
+def _iter_campaigns(
+    client: "AppleSearchAdsClient",
+    selector: Selector | None = None,
+    use_cache: bool = True,
+    page_size: int = CAMPAIGN_PAGE_SIZE,
+) -> Iterator[Campaign]:
+    """Iterate campaigns page by page, reusing a recent on-disk copy if available.
+
+    Campaigns are yielded as each page arrives, so callers can start work on
+    the first page while later pages are still being fetched. The listing is
+    cached once it has been fully consumed.
+
+    Args:
+        client: The API client.
+        selector: Optional selector to find campaigns with; lists all campaigns if omitted.
+        use_cache: Whether to read from the cache.
+        page_size: Number of campaigns requested per page.
+
+    Yields:
+        The matching campaigns.
+    """
+    query = selector.model_dump(mode="json", by_alias=True, exclude_none=True) if selector else None
+    key = cache_key(client.org_id, "campaigns", query)
+    if use_cache:
+        cached = cache_get("campaigns", key, ttl=CAMPAIGN_CACHE_TTL)
+        if cached is not None:
+            for c in cached:
+                yield Campaign.model_validate(c)
+            return
+
+    campaigns: list[Campaign] = []
+    while True:
+        if selector:
+            page = client.campaigns.find(selector.model_copy(deep=True).limit(page_size).offset(len(campaigns)))
+        else:
+            page = client.campaigns.list(limit=page_size, offset=len(campaigns))
+        campaigns.extend(page.data)
+        yield from page.data
+        if not page.data or not page.has_more:
+            break
+
+    cache_set("campaigns", key, [c.model_dump(mode="json", by_alias=True) for c in campaigns])
+
+
+def _cached_campaigns(
+    client: "AppleSearchAdsClient",
+    selector: Selector | None = None,
+    use_cache: bool = True,
+) -> list[Campaign]:
+    """List campaigns, reusing a recent on-disk copy if available.
+
+    Args:
+        client: The API client.
+        selector: Optional selector to find campaigns with; lists all campaigns if omitted.
+        use_cache: Whether to read from the cache.
+
+    Returns:
+        The matching campaigns.
+    """
+    return list(_iter_campaigns(client, selector, use_cache=use_cache))
+
+
+def _cached_keyword_report(
+    client: "AppleSearchAdsClient",
+    campaign_id: int,
+    start_date: date,
+    end_date: date,
+    refresh: bool = False,
+) -> ReportingResponse:
+    """Fetch a daily keyword report through the report cache.
+
+    Args:
+        client: The API client.
+        campaign_id: The campaign to report on.
+        start_date: Report start date.
+        end_date: Report end date.
+        refresh: Skip the cache read and fetch a fresh report.
+
+    Returns:
+        The keyword report.
+    """
+    return cached_report(
+        client,
+        "keywords",
+        refresh=refresh,
+        campaign_id=campaign_id,
+        start_date=start_date,
+        end_date=end_date,
+        granularity=GranularityType.DAILY,
+    )
+
+
+def _forget_keyword_report(
+    client: "AppleSearchAdsClient",
+    campaign_id: int,
+    start_date: date,
+    end_date: date,
+) -> None:
+    """Drop a cached daily keyword report after its keywords were changed.
+
+    Args:
+        client: The API client.
+        campaign_id: The campaign the report is for.
+        start_date: Report start date.
+        end_date: Report end date.
+    """
+    forget_report(
+        client,
+        "keywords",
+        campaign_id=campaign_id,
+        start_date=start_date,
+        end_date=end_date,
+        granularity=GranularityType.DAILY,
+    )
+
+
+@dataclass(slots=True)
+class KeywordBidStats:
+    """Running keyword bid statistics for one ad group."""
+
+    total: float = 0.0
+    count: int = 0
+    low: float = float("inf")
+    high: float = float("-inf")
+
+    def add(self, bid: float) -> None:
+        """Include one keyword bid."""
+        self.total += bid
+        self.count += 1
+        if bid < self.low:
+            self.low = bid
+        if bid > self.high:
+            self.high = bid
+
+    @property
+    def mean(self) -> float:
+        """Average keyword bid."""
+        return self.total / self.count
+
+
+def _keyword_bids_by_ad_group(report: ReportingResponse) -> dict[int, KeywordBidStats]:
+    """Summarise the current keyword bids in a keyword report by ad group.
+
+    Statistics are accumulated in a single pass over the report, so no
+    per-ad-group bid lists are kept.
+
+    Args:
+        report: A keyword-level report for one campaign.
+
+    Returns:
+        Mapping of ad group ID to bid statistics of its non-deleted keywords.
+        Keywords without metrics in the report window don't appear in it.
+    """
+    stats: defaultdict[int, KeywordBidStats] = defaultdict(KeywordBidStats)
+    for row in report.row or []:
+        md = row.metadata
+        if md.ad_group_id and md.bid_amount and not md.deleted:
+            stats[md.ad_group_id].add(float(md.bid_amount.amount))
+    return stats
+
+
+def _find_bid_discrepancy(
+    campaign: Campaign,
+    ad_group: AdGroup,
+    keyword_bids: KeywordBidStats | None,
+    threshold: float,
+) -> BidDiscrepancy | None:
+    """Compare an ad group's default bid with its keyword bids.
+
+    Args:
+        campaign: The parent campaign.
+        ad_group: The ad group to check.
+        keyword_bids: Bid statistics of the ad group's keywords, if it has any.
+        threshold: Minimum percentage by which the keyword average must exceed
+            the ad group bid to be flagged.
+
+    Returns:
+        The discrepancy, or None if the ad group is not flagged.
+    """
+    if keyword_bids is None or not keyword_bids.count:
+        return None
+
+    ad_group_bid = Decimal(ad_group.default_bid_amount.amount)
+
+    # Check if there's a material discrepancy
+    # (keywords are higher than ad group bid)
+    if ad_group_bid <= 0:
+        return None
+
+    # Bids have two decimal places, so float statistics are exact enough;
+    # only the values kept on the discrepancy go back to Decimal.
+    keyword_avg = keyword_bids.mean
+    diff_pct = (keyword_avg - float(ad_group_bid)) / float(ad_group_bid) * 100
+    if diff_pct < threshold:
+        return None
+
+    return BidDiscrepancy(
+        campaign_id=campaign.id,
+        campaign_name=campaign.name,
+        ad_group_id=ad_group.id,
+        ad_group_name=ad_group.name,
+        ad_group_bid=ad_group_bid,
+        keyword_avg_bid=Decimal(f"{keyword_avg:.2f}"),
+        keyword_min_bid=Decimal(f"{keyword_bids.low:.2f}"),
+        keyword_max_bid=Decimal(f"{keyword_bids.high:.2f}"),
+        keyword_count=keyword_bids.count,
+        currency=ad_group.default_bid_amount.currency,
+    )
 
 
 @app.command("bid-check")
@@ -127,11 +501,28 @@ def check_bid_discrepancies(
             help="Show what would be changed without making changes",
         ),
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Always fetch campaigns and keyword reports from the API instead of the local cache",
+        ),
+    ] = False,
+    top: Annotated[
+        int | None,
+        typer.Option("--top", help="Only show the N largest discrepancies"),
+    ] = None,
+    parallel: Annotated[
+        int,
+        typer.Option("--parallel", help="Concurrent bid updates with --auto-fix"),
+    ] = UPDATE_WORKERS,
 ) -> None:
     """Check for bid discrepancies between ad group and keyword levels.
 
     Scans all enabled campaigns and ad groups, comparing the ad group default
-    bid to the average of keyword-level bids. Flags cases where keywords have
+    bid to the average bid of its keywords that had activity in the last 30
+    days. Keywords with no activity in that window are not in the keyword
+    report and are left out of the average. Flags cases where keywords have
     materially higher bids than the ad group default.
 
     This is useful because when keyword bids are much higher than the ad group
@@ -142,84 +533,78 @@ def check_bid_discrepancies(
         asa optimize bid-check                    # Check with 20% threshold
         asa optimize bid-check --threshold 50    # Flag only >50% differences
         asa optimize bid-check --dry-run         # Preview without changes
+        asa optimize bid-check --top 10          # Only the 10 largest differences
         asa optimize bid-check --auto-fix        # Apply all suggestions
+        asa optimize bid-check --no-cache        # Ignore cached campaigns and reports
     """
     client = get_client()
     discrepancies: list[BidDiscrepancy] = []
 
     try:
         with client:
-            # Get all enabled campaigns
-            with spinner("Scanning enabled campaigns..."):
-                campaigns = list(client.campaigns.find(Selector().where("status", "==", "ENABLED")))
-
-            print_info(f"Found {len(campaigns)} enabled campaigns")
-            console.print()
+            # End yesterday, like bid-review, so the report is a closed range the report cache can reuse
+            end_date = date.today() - timedelta(days=1)
+            start_date = end_date - timedelta(days=BID_CHECK_DAYS)
+
+            def fetch_ad_groups(campaign: Campaign) -> list[AdGroup]:
+                return list(client.campaigns(campaign.id).ad_groups.find(Selector().where("status", "==", "ENABLED")))
+
+            def fetch_keyword_bids(campaign: Campaign) -> dict[int, KeywordBidStats]:
+                report = _cached_keyword_report(client, campaign.id, start_date, end_date, refresh=no_cache)
+                return _keyword_bids_by_ad_group(report)
+
+            # Ad groups and keyword bids come from one request each per campaign
+            scans: list[tuple[Campaign, Future[list[AdGroup]], Future[dict[int, KeywordBidStats]]]] = []
+            with create_progress() as progress, ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+                task = progress.add_task("Scanning campaigns...", total=None)
+
+                # Start scanning each campaign as soon as its page of the listing arrives
+                enabled = Selector().where("status", "==", "ENABLED")
+                for campaign in _iter_campaigns(client, enabled, use_cache=not no_cache):
+                    scans.append(
+                        (
+                            campaign,
+                            executor.submit(fetch_ad_groups, campaign),
+                            executor.submit(fetch_keyword_bids, campaign),
+                        )
+                    )
+                progress.update(task, total=len(scans))
 
-            # Scan each campaign's ad groups
-            for campaign in campaigns:
-                with spinner(f"Scanning {campaign.name}..."):
+                for campaign, ad_groups_future, bids_future in scans:
                     try:
-                        ad_groups = list(
-                            client.campaigns(campaign.id).ad_groups.find(Selector().where("status", "==", "ENABLED"))
-                        )
+                        ad_groups = ad_groups_future.result()
+                        keyword_bids = bids_future.result()
                     except AppleSearchAdsError:
                         # Skip campaigns we can't access
+                        progress.advance(task)
                         continue
 
                     for ag in ad_groups:
-                        # Get keywords for this ad group
-                        try:
-                            keywords = list(client.campaigns(campaign.id).ad_groups(ag.id).keywords.list())
-                        except AppleSearchAdsError:
-                            continue
-
-                        if not keywords:
-                            continue
+                        discrepancy = _find_bid_discrepancy(campaign, ag, keyword_bids.get(ag.id), threshold)
+                        if discrepancy is not None:
+                            discrepancies.append(discrepancy)
+                    progress.advance(task)
 
-                        # Calculate keyword bid statistics
-                        keyword_bids = [Decimal(kw.bid_amount.amount) for kw in keywords if kw.bid_amount]
-
-                        if not keyword_bids:
-                            continue
-
-                        ad_group_bid = Decimal(ag.default_bid_amount.amount)
-                        keyword_avg = Decimal(sum(keyword_bids) / len(keyword_bids))
-                        keyword_min = min(keyword_bids)
-                        keyword_max = max(keyword_bids)
-                        currency = ag.default_bid_amount.currency
-
-                        # Check if there's a material discrepancy
-                        # (keywords are higher than ad group bid)
-                        if ad_group_bid > 0:
-                            diff_pct = float((keyword_avg - ad_group_bid) / ad_group_bid * 100)
-                            if diff_pct >= threshold:
-                                discrepancies.append(
-                                    BidDiscrepancy(
-                                        campaign_id=campaign.id,
-                                        campaign_name=campaign.name,
-                                        ad_group_id=ag.id,
-                                        ad_group_name=ag.name,
-                                        ad_group_bid=ad_group_bid,
-                                        keyword_avg_bid=keyword_avg,
-                                        keyword_min_bid=keyword_min,
-                                        keyword_max_bid=keyword_max,
-                                        keyword_count=len(keyword_bids),
-                                        currency=currency,
-                                    )
-                                )
+            print_info(f"Scanned {len(scans)} enabled campaigns")
+            console.print()
 
             if not discrepancies:
                 print_success(f"No bid discrepancies found above {threshold}% threshold")
                 return
 
-            # Sort by difference percentage descending
-            discrepancies.sort(key=lambda d: d.difference_pct, reverse=True)
+            # Sort by difference percentage descending; a partial sort is enough for --top
+            total_found = len(discrepancies)
+            by_difference = attrgetter("difference_pct")
+            if top is not None:
+                discrepancies = heapq.nlargest(max(top, 0), discrepancies, key=by_difference)
+            else:
+                discrepancies.sort(key=by_difference, reverse=True)
 
             # Display summary table
             console.print()
             table = Table(
-                title=f"Bid Discrepancies Found ({len(discrepancies)} ad groups)",
+                title=f"Bid Discrepancies Found ({total_found} ad groups"
+                + (f", top {len(discrepancies)} shown)" if len(discrepancies) < total_found else ")"),
                 show_header=True,
                 header_style="header",
             )
@@ -231,14 +616,7 @@ def check_bid_discrepancies(
             table.add_column("Keywords", justify="center")
 
             for d in discrepancies:
-                table.add_row(
-                    d.campaign_name[:25] + ("..." if len(d.campaign_name) > 25 else ""),
-                    d.ad_group_name[:20] + ("..." if len(d.ad_group_name) > 20 else ""),
-                    _format_bid(d.ad_group_bid, d.currency),
-                    _format_bid(d.keyword_avg_bid, d.currency),
-                    f"+{d.difference_pct:.0f}%",
-                    str(d.keyword_count),
-                )
+                table.add_row(*d.display_row)
 
             console.print(table)
             console.print()
@@ -247,33 +625,60 @@ def check_bid_discrepancies(
                 print_info("Dry run mode - no changes will be made")
                 return
 
-            # Interactive mode - process each discrepancy
-            changes_made = 0
-            for i, d in enumerate(discrepancies, 1):
-                console.rule(f"[bold]{i}/{len(discrepancies)}")
-                console.print()
+            def update_bid(d: BidDiscrepancy, new_bid: Decimal) -> None:
+                client.campaigns(d.campaign_id).ad_groups.update(
+                    d.ad_group_id,
+                    data=AdGroupUpdate(
+                        default_bid_amount=Money(
+                            amount=format(new_bid, "f"),
+                            currency=d.currency,
+                        )
+                    ),
+                )
 
-                # Show details
-                console.print(f"[bold]Campaign:[/bold] {d.campaign_name}")
-                console.print(f"[bold]Ad Group:[/bold] {d.ad_group_name}")
-                console.print()
-                console.print(f"  Current ad group bid:  [dim]{_format_bid(d.ad_group_bid, d.currency)}[/dim]")
-                console.print(f"  Keyword average bid:   [yellow]{_format_bid(d.keyword_avg_bid, d.currency)}[/yellow]")
-                min_bid = _format_bid(d.keyword_min_bid, d.currency)
-                max_bid = _format_bid(d.keyword_max_bid, d.currency)
-                console.print(f"  Keyword range:         {min_bid} - {max_bid}")
-                console.print(f"  Difference:            [red]+{d.difference_pct:.0f}%[/red]")
-                console.print()
+            changes_made = 0
+            if auto_fix:
+                # Updates are independent, so apply the suggested bids concurrently
+                limiter = RateLimiter(UPDATE_RATE_LIMIT)
+                with (
+                    create_progress() as progress,
+                    ThreadPoolExecutor(max_workers=max(1, min(parallel, len(discrepancies)))) as executor,
+                ):
+                    task = progress.add_task("Updating ad group bids...", total=len(discrepancies))
+                    updates = {
+                        executor.submit(call_with_backoff, partial(update_bid, d, d.suggested_bid), limiter): d
+                        for d in discrepancies
+                    }
+                    for future in as_completed(updates):
+                        d = updates[future]
+                        progress.advance(task)
+                        try:
+                            future.result()
+                        except AppleSearchAdsError as e:
+                            print_warning(f"Could not update {d.ad_group_name}: {e.message}")
+                            continue
+                        print_success(
+                            f"{d.campaign_name} / {d.ad_group_name}: {d.ad_group_bid_str} → {d.suggested_bid_str}"
+                        )
+                        changes_made += 1
+            else:
+                # Interactive mode - process each discrepancy
+                for i, d in enumerate(discrepancies, 1):
+                    console.rule(f"[bold]{i}/{len(discrepancies)}")
+                    console.print()
 
-                suggested_bid = round(d.keyword_avg_bid, 2)
+                    # Show details
+                    console.print(f"[bold]Campaign:[/bold] {d.campaign_name}")
+                    console.print(f"[bold]Ad Group:[/bold] {d.ad_group_name}")
+                    console.print()
+                    console.print(f"  Current ad group bid:  [dim]{d.ad_group_bid_str}[/dim]")
+                    console.print(f"  Keyword average bid:   [yellow]{d.keyword_avg_bid_str}[/yellow]")
+                    console.print(f"  Keyword range:         {d.keyword_min_bid_str} - {d.keyword_max_bid_str}")
+                    console.print(f"  Difference:            [red]+{d.difference_pct:.0f}%[/red]")
+                    console.print()
 
-                if auto_fix:
-                    # Apply suggested change without prompting
-                    new_bid = suggested_bid
-                    action = "apply"
-                else:
                     # Interactive prompt
-                    console.print(f"[bold]Suggested new bid:[/bold] {_format_bid(suggested_bid, d.currency)}")
+                    console.print(f"[bold]Suggested new bid:[/bold] {d.suggested_bid_str}")
                     console.print()
 
                     action = typer.prompt(
@@ -302,28 +707,18 @@ def check_bid_discrepancies(
                             print_warning("Invalid bid amount, skipping")
                             continue
                     elif action == "apply" or action == "a":
-                        new_bid = suggested_bid
+                        new_bid = d.suggested_bid
                     else:
                         print_warning(f"Unknown action '{action}', skipping")
                         continue
 
-                # Apply the change
-                with spinner("Updating ad group bid..."):
-                    client.campaigns(d.campaign_id).ad_groups.update(
-                        d.ad_group_id,
-                        data=AdGroupUpdate(
-                            default_bid_amount=Money(
-                                amount=str(new_bid),
-                                currency=d.currency,
-                            )
-                        ),
-                    )
+                    # Apply the change
+                    with spinner("Updating ad group bid..."):
+                        update_bid(d, new_bid)
 
-                print_success(
-                    f"Updated bid: {_format_bid(d.ad_group_bid, d.currency)} → {_format_bid(new_bid, d.currency)}"
-                )
-                changes_made += 1
-                console.print()
+                    print_success(f"Updated bid: {d.ad_group_bid_str} → {_format_bid(new_bid, d.currency)}")
+                    changes_made += 1
+                    console.print()
 
             # Summary
             console.print()
@@ -352,7 +747,6 @@ class KeywordPlan:
     currency: str
     source_count: int  # Number of source campaigns this keyword appeared in
     impressions: int = 0  # Total impressions in last 90 days
-    source_bids: list[Decimal] = field(default_factory=list)
 
 
 @dataclass
@@ -361,7 +755,12 @@ class AdGroupPlan:
 
     name: str
     keyword: KeywordPlan
-    negatives: list[str] = field(default_factory=list)
+
+    @cached_property
+    def display_name(self) -> str:
+        """Name shortened for the plan preview table."""
+        name = self.name
+        return name[:30] + "..." if len(name) > 30 else name
 
 
 @dataclass
@@ -374,9 +773,60 @@ class CampaignPlan:
     daily_budget: Decimal
     currency: str
     ad_groups: list[AdGroupPlan] = field(default_factory=list)
+    all_keywords: frozenset[str] = frozenset()  # Every planned keyword, shared by all ad groups
 
+    def negatives_for(self, keyword: str) -> Iterator[str]:
+        """Iterate the cross-negatives for the ad group targeting the given keyword.
 
-@dataclass
+        Each ad group excludes every other planned keyword but not its own,
+        so negatives are streamed from the shared set only when uploading.
+        """
+        return (k for k in self.all_keywords if k != keyword)
+
+    @property
+    def total_negatives(self) -> int:
+        """Total number of cross-negatives across all ad groups."""
+        n = len(self.all_keywords)
+        return n * (n - 1)
+
+
+# Longest campaign name the API accepts
+MAX_CAMPAIGN_NAME_LENGTH = 200
+
+# Longest keyword text the API accepts
+MAX_KEYWORD_LENGTH = 80
+
+# Most plan problems listed before the rest are summarized
+MAX_PLAN_PROBLEMS = 10
+
+
+def _plan_problems(plan: CampaignPlan) -> list[str]:
+    """Check a campaign plan for values the API is known to reject.
+
+    Args:
+        plan: The plan to check.
+
+    Returns:
+        A description of each problem found; empty if the plan looks valid.
+    """
+    problems: list[str] = []
+    if not plan.ad_groups:
+        problems.append("The plan has no keywords to create ad groups for")
+    if plan.daily_budget <= 0:
+        problems.append(f"Daily budget must be positive (got {plan.daily_budget})")
+    if not plan.name or len(plan.name) > MAX_CAMPAIGN_NAME_LENGTH:
+        problems.append(f"Campaign name must be 1-{MAX_CAMPAIGN_NAME_LENGTH} characters")
+    if len(plan.country) != 2 or not plan.country.isalpha():
+        problems.append(f"'{plan.country}' is not a two-letter country code")
+    for ag in plan.ad_groups:
+        if len(ag.keyword.text) > MAX_KEYWORD_LENGTH:
+            problems.append(f"Keyword '{ag.keyword.text}' is longer than {MAX_KEYWORD_LENGTH} characters")
+        if ag.keyword.bid <= 0:
+            problems.append(f"Keyword '{ag.keyword.text}' has no positive bid")
+    return problems
+
+
+@dataclass(frozen=True)
 class CampaignNameParts:
     """Parsed campaign name parts."""
 
@@ -390,44 +840,131 @@ class CampaignNameParts:
     def parse(cls, name: str) -> "CampaignNameParts | None":
         """Parse campaign name in format: App Name - Country - Type - Match.
 
+        Results are cached, so parsing the same name again is a dict lookup.
+
         Examples:
             'Chippy Tools - US - Generic - Exact Match' -> parts
             'Concrete Tools - AU - Competitor - EM' -> parts
         """
-        parts = [p.strip() for p in name.split(" - ")]
-        if len(parts) < 4:
-            return None
-
-        # Last part is match type
-        match_type_raw = parts[-1].upper()
-        if match_type_raw in ("EM", "EXACT MATCH"):
-            match_type = "EM"
-        elif match_type_raw in ("BM", "BROAD MATCH", "SM", "SEARCH MATCH"):
-            match_type = "BM"
+        return _parse_campaign_name(name)
+
+    def with_country(self, new_country: str) -> str:
+        """Generate new campaign name with different country."""
+        match_type_full = "Exact Match" if self.match_type == "EM" else "Broad Match"
+        return f"{self.app_name} - {new_country} - {self.campaign_type} - {match_type_full}"
+
+
+@lru_cache(maxsize=4096)
+def _parse_campaign_name(name: str) -> CampaignNameParts | None:
+    """Parse a campaign name; see CampaignNameParts.parse."""
+    parts = [p.strip() for p in name.split(" - ")]
+    if len(parts) < 4:
+        return None
+
+    # Last part is match type
+    match_type_raw = parts[-1].upper()
+    if match_type_raw in ("EM", "EXACT MATCH"):
+        match_type = "EM"
+    elif match_type_raw in ("BM", "BROAD MATCH", "SM", "SEARCH MATCH"):
+        match_type = "BM"
+    else:
+        return None
+
+    # Second to last is campaign type
+    campaign_type = parts[-2]
+
+    # Second part is country (could be multi-letter code)
+    country = parts[1].upper()
+
+    # Everything before country is app name
+    app_name = parts[0]
+
+    return CampaignNameParts(
+        app_name=app_name,
+        country=country,
+        campaign_type=campaign_type,
+        match_type=match_type,
+        original=name,
+    )
+
+
+# Pre-rendered status cells for the campaign selection table; other statuses are shown in yellow
+_STATUS_CELLS = {
+    "ENABLED": "[green]ENABLED[/green]",
+    "PAUSED": "[yellow]PAUSED[/yellow]",
+}
+
+# One selection item: a number or a range ("5" or "5-7"), followed by a comma or the end
+_SELECTION_RE = re.compile(r"\s*(\d+)(?:\s*-\s*(\d+))?\s*(?:,|$)")
+
+
+# Number of rows shown per page of the campaign selection table
+SELECTION_PAGE_SIZE = 50
+
+# Divider row between campaign types in the campaign selection table
+_DIVIDER_ROW = ("[dim]·[/dim]",) * 7
+
+
+def _selection_table(rows: list[tuple[str, ...] | None]) -> Table:
+    """Build one page of the campaign selection table.
+
+    Args:
+        rows: Row cells, with None marking the end of an app's section
+
+    Returns:
+        Rich Table for the given rows
+    """
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("#", justify="right", style="dim")
+    table.add_column("App")
+    table.add_column("Country")
+    table.add_column("Type")
+    table.add_column("Match")
+    table.add_column("Status")
+    table.add_column("ID", style="dim")
+
+    for row in rows:
+        if row is None:
+            table.add_section()
+        elif row is _DIVIDER_ROW:
+            table.add_row(*row, style="dim")
         else:
-            return None
+            table.add_row(*row)
+    return table
 
-        # Second to last is campaign type
-        campaign_type = parts[-2]
 
-        # Second part is country (could be multi-letter code)
-        country = parts[1].upper()
+def _build_parsed_campaign_list(
+    campaigns: list[Any],
+    campaign_type_filter: str | None = None,
+    match_type_filter: str | None = None,
+) -> list[tuple[Any, CampaignNameParts]]:
+    """Pair campaigns with their parsed names, dropping unparseable or filtered ones.
 
-        # Everything before country is app name
-        app_name = parts[0]
+    Parsing goes through the memoized CampaignNameParts.parse, so names seen
+    earlier in the process are not parsed again.
 
-        return cls(
-            app_name=app_name,
-            country=country,
-            campaign_type=campaign_type,
-            match_type=match_type,
-            original=name,
-        )
+    Args:
+        campaigns: List of Campaign objects
+        campaign_type_filter: Filter by type (Generic, Competitor, Brand)
+        match_type_filter: Filter by match type (EM, BM)
 
-    def with_country(self, new_country: str) -> str:
-        """Generate new campaign name with different country."""
-        match_type_full = "Exact Match" if self.match_type == "EM" else "Broad Match"
-        return f"{self.app_name} - {new_country} - {self.campaign_type} - {match_type_full}"
+    Returns:
+        List of (campaign, parsed name) pairs
+    """
+    type_filter = campaign_type_filter.lower() if campaign_type_filter else None
+    match_filter = match_type_filter.upper() if match_type_filter else None
+
+    parsed_campaigns: list[tuple[Any, CampaignNameParts]] = []
+    for c in campaigns:
+        parsed = CampaignNameParts.parse(c.name)
+        if parsed is None:
+            continue
+        if type_filter and parsed.campaign_type.lower() != type_filter:
+            continue
+        if match_filter and parsed.match_type != match_filter:
+            continue
+        parsed_campaigns.append((c, parsed))
+    return parsed_campaigns
 
 
 def _select_campaigns_interactive(
@@ -445,19 +982,7 @@ def _select_campaigns_interactive(
     Returns:
         List of selected Campaign objects
     """
-    # Parse and filter campaigns
-    parsed_campaigns: list[tuple[Any, CampaignNameParts]] = []
-
-    for c in campaigns:
-        parsed = CampaignNameParts.parse(c.name)
-        if parsed:
-            # Apply filters
-            if campaign_type_filter and parsed.campaign_type.lower() != campaign_type_filter.lower():
-                continue
-            if match_type_filter and parsed.match_type != match_type_filter.upper():
-                continue
-            parsed_campaigns.append((c, parsed))
-
+    parsed_campaigns = _build_parsed_campaign_list(campaigns, campaign_type_filter, match_type_filter)
     if not parsed_campaigns:
         return []
 
@@ -466,85 +991,79 @@ def _select_campaigns_interactive(
     for c, parsed in parsed_campaigns:
         apps[parsed.app_name].append((c, parsed))
 
-    # Display selection table
-    console.print()
-    console.print("[bold]Available campaigns:[/bold]")
-    console.print()
-
-    table = Table(show_header=True, header_style="bold")
-    table.add_column("#", justify="right", style="dim")
-    table.add_column("App")
-    table.add_column("Country")
-    table.add_column("Type")
-    table.add_column("Match")
-    table.add_column("Status")
-    table.add_column("ID", style="dim")
-
+    # Collect the rows first; the Rich table is only built for the rows shown
     campaign_list: list[tuple[Any, CampaignNameParts]] = []
-    idx = 1
+    rows: list[tuple[str, ...] | None] = []
     sorted_apps = sorted(apps.keys())
     for app_idx, app_name in enumerate(sorted_apps):
         app_campaigns = sorted(apps[app_name], key=lambda x: (x[1].campaign_type, x[1].country))
         last_type = None
-        for _camp_idx, (c, parsed) in enumerate(app_campaigns):
+        for c, parsed in app_campaigns:
             # Add a dim divider row between campaign types (within same app)
             if last_type is not None and parsed.campaign_type != last_type:
-                table.add_row(
-                    "[dim]·[/dim]",
-                    "[dim]·[/dim]",
-                    "[dim]·[/dim]",
-                    "[dim]·[/dim]",
-                    "[dim]·[/dim]",
-                    "[dim]·[/dim]",
-                    "[dim]·[/dim]",
-                    style="dim",
-                )
+                rows.append(_DIVIDER_ROW)
 
             campaign_list.append((c, parsed))
-            status_color = "green" if enum_value(c.status) == "ENABLED" else "yellow"
-
-            table.add_row(
-                str(idx),
-                parsed.app_name[:20],
-                parsed.country,
-                parsed.campaign_type,
-                parsed.match_type,
-                f"[{status_color}]{enum_value(c.status)}[/{status_color}]",
-                str(c.id),
+            status_str = enum_value(c.status)
+            status_cell = _STATUS_CELLS.get(status_str) or f"[yellow]{status_str}[/yellow]"
+
+            rows.append(
+                (
+                    str(len(campaign_list)),
+                    parsed.app_name[:20],
+                    parsed.country,
+                    parsed.campaign_type,
+                    parsed.match_type,
+                    status_cell,
+                    str(c.id),
+                )
             )
-            idx += 1
             last_type = parsed.campaign_type
         # Add section divider after each app group (except the last one)
         if app_idx < len(sorted_apps) - 1:
-            table.add_section()
+            rows.append(None)
 
-    console.print(table)
+    # Display selection table a page at a time; a selection can be entered after any page
+    console.print()
+    console.print("[bold]Available campaigns:[/bold]")
     console.print()
 
-    # Get selection
     console.print("[dim]Enter campaign numbers separated by commas, ranges (1-3), or 'all'[/dim]")
-    selection = typer.prompt("Select campaigns", default="all")
+    selection = ""
+    for start in range(0, len(rows), SELECTION_PAGE_SIZE):
+        console.print(_selection_table(rows[start : start + SELECTION_PAGE_SIZE]))
+        console.print()
+        if start + SELECTION_PAGE_SIZE < len(rows):
+            selection = typer.prompt(
+                "Select campaigns (Enter to show more)",
+                default="",
+                show_default=False,
+            ).strip()
+            if selection:
+                break
+
+    # Get selection
+    if not selection:
+        selection = typer.prompt("Select campaigns", default="all")
 
     if selection.lower() == "all":
         return [c for c, _ in campaign_list]
 
     # Parse selection (e.g., "1,2,5-7,10")
     selected_indices: set[int] = set()
-    for part in selection.split(","):
-        part = part.strip()
-        if "-" in part:
-            try:
-                start, end = part.split("-")
-                selected_indices.update(range(int(start), int(end) + 1))
-            except ValueError:
-                continue
-        else:
-            try:
-                selected_indices.add(int(part))
-            except ValueError:
-                continue
+    consumed = 0
+    for match in _SELECTION_RE.finditer(selection):
+        consumed += len(match.group(0))
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else start
+        # Clamp to the listed rows so a typo like "1-99999999" can't build a huge set
+        selected_indices.update(range(max(start, 1), min(end, len(campaign_list)) + 1))
 
-    return [c for i, (c, _) in enumerate(campaign_list, 1) if i in selected_indices]
+    if consumed != len(selection):
+        print_warning("Ignored unrecognized parts of the selection")
+
+    # Indices are already clamped to 1..len(campaign_list)
+    return [campaign_list[i - 1][0] for i in sorted(selected_indices)]
 
 
 @app.command("expand")
@@ -585,6 +1104,14 @@ def expand_campaign(
         bool,
         typer.Option("--paused", "-p", help="Create campaign in PAUSED state"),
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Always fetch campaigns and keyword reports from the API"),
+    ] = False,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", min=1, help="Concurrent ad group and negative keyword creations"),
+    ] = CREATE_WORKERS,
 ) -> None:
     """Expand campaigns to a new market.
 
@@ -622,6 +1149,12 @@ def expand_campaign(
         # Create paused (for review before enabling)
         asa optimize expand --country CA --paused
     """
+    if concurrency > MAX_SUGGESTED_CONCURRENCY:
+        print_warning(
+            f"--concurrency {concurrency} is above {MAX_SUGGESTED_CONCURRENCY}; "
+            "requests are still limited to the API rate limit"
+        )
+
     client = get_client()
 
     try:
@@ -630,19 +1163,30 @@ def expand_campaign(
             source_campaign_data = []
 
             if source_campaigns:
-                # Non-interactive: load specified campaign IDs
+                # Non-interactive: load all specified campaign IDs in one request
+                selector = (
+                    Selector()
+                    .where("id", "in", [str(campaign_id) for campaign_id in source_campaigns])
+                    .limit(len(source_campaigns))
+                )
                 with spinner("Loading source campaigns..."):
-                    for campaign_id in source_campaigns:
-                        try:
-                            campaign = client.campaigns.get(campaign_id)
-                            source_campaign_data.append(campaign)
-                        except AppleSearchAdsError as e:
-                            print_error("Error", f"Could not load campaign {campaign_id}: {e.message}")
-                            raise typer.Exit(1) from None
+                    try:
+                        found = {c.id: c for c in client.campaigns.find(selector)}
+                    except AppleSearchAdsError as e:
+                        print_error("Error", f"Could not load source campaigns: {e.message}")
+                        raise typer.Exit(1) from None
+
+                missing = [str(campaign_id) for campaign_id in source_campaigns if campaign_id not in found]
+                if missing:
+                    print_error("Error", f"Could not load campaign(s): {', '.join(missing)}")
+                    raise typer.Exit(1)
+
+                # Keep the order the campaigns were given in
+                source_campaign_data = [found[campaign_id] for campaign_id in dict.fromkeys(source_campaigns)]
             else:
                 # Interactive: show all campaigns and let user select
                 with spinner("Loading campaigns..."):
-                    all_campaigns = list(client.campaigns.list())
+                    all_campaigns = _cached_campaigns(client, use_cache=not no_cache)
 
                 source_campaign_data = _select_campaigns_interactive(
                     all_campaigns,
@@ -679,68 +1223,82 @@ def expand_campaign(
 
             # Step 2: Extract keywords with impressions from last 90 days
             # Use reports API to get keywords that have actually had impressions
-            keyword_bids: dict[str, list[Decimal]] = defaultdict(list)
+            # Running bid totals per keyword, so memory grows with keywords rather than report rows
+            keyword_bid_sum: dict[str, float] = defaultdict(float)
+            keyword_bid_count: dict[str, int] = defaultdict(int)
             keyword_impressions: dict[str, int] = defaultdict(int)
 
             end_date = date.today()
             start_date = end_date - timedelta(days=90)
 
-            for campaign in source_campaign_data:
-                with spinner(f"Fetching keyword performance for {campaign.name} (90 days)..."):
+            with (
+                create_progress() as progress,
+                ThreadPoolExecutor(max_workers=min(REPORT_WORKERS, len(source_campaign_data))) as executor,
+            ):
+                task = progress.add_task("Fetching keyword performance (90 days)...", total=len(source_campaign_data))
+                futures = {
+                    executor.submit(
+                        _cached_keyword_report,
+                        client,
+                        campaign_id=campaign.id,
+                        start_date=start_date,
+                        end_date=end_date,
+                        refresh=no_cache,
+                    ): campaign
+                    for campaign in source_campaign_data
+                }
+
+                # Workers only fetch; merging happens here on the main thread
+                for future in as_completed(futures):
+                    campaign = futures[future]
+                    progress.advance(task)
                     try:
-                        # Get keyword report for last 90 days
-                        report = client.reports.keywords(
-                            campaign_id=campaign.id,
-                            start_date=start_date,
-                            end_date=end_date,
-                            granularity=GranularityType.DAILY,
-                        )
-
-                        for row in report.row:
-                            if row.metadata.keyword and row.total:
-                                kw_text = row.metadata.keyword.lower()
-                                impressions = row.total.impressions
-
-                                # Only include keywords with impressions
-                                if impressions > 0:
-                                    keyword_impressions[kw_text] += impressions
-
-                                    # Get bid from report metadata or use a default
-                                    if row.metadata.bid_amount:
-                                        keyword_bids[kw_text].append(Decimal(row.metadata.bid_amount.amount))
-
+                        report = future.result()
                     except AppleSearchAdsError as e:
                         print_warning(f"Could not get report for {campaign.name}: {e.message}")
                         continue
 
-            # Filter to only keywords that had impressions
-            active_keywords = set(keyword_impressions.keys())
-            keyword_bids = {k: v for k, v in keyword_bids.items() if k in active_keywords}
+                    for row in report.row:
+                        # Deleted keywords shouldn't be carried into the new market
+                        if row.metadata.deleted:
+                            continue
+                        if row.metadata.keyword and row.total:
+                            kw_text = row.metadata.keyword.lower()
+                            impressions = row.total.impressions
+
+                            # Only include keywords with impressions
+                            if impressions > 0:
+                                keyword_impressions[kw_text] += impressions
+
+                                # Get bid from report metadata or use a default
+                                if row.metadata.bid_amount:
+                                    keyword_bid_sum[kw_text] += float(row.metadata.bid_amount.amount)
+                                    keyword_bid_count[kw_text] += 1
 
-            if not keyword_bids:
+            # keyword_bid_count only holds keywords that had impressions (filtered while merging)
+            if not keyword_bid_count:
                 print_error("Error", "No keywords with impressions found in last 90 days")
                 raise typer.Exit(1)
 
             total_impressions = sum(keyword_impressions.values())
-            print_info(f"Found {len(keyword_bids)} keywords with {total_impressions:,} impressions in last 90 days")
+            print_info(
+                f"Found {len(keyword_bid_count)} keywords with {total_impressions:,} impressions in last 90 days"
+            )
 
             # Step 3: Calculate average bids
             keyword_plans: list[KeywordPlan] = []
-            for text, bids in keyword_bids.items():
-                avg_bid = Decimal(sum(bids) / len(bids))
+            for text, count in keyword_bid_count.items():
+                avg_bid = keyword_bid_sum[text] / count
                 keyword_plans.append(
                     KeywordPlan(
                         text=text,
-                        bid=round(avg_bid, 2),
+                        bid=Decimal(f"{avg_bid:.2f}"),
                         currency=currency,
-                        source_count=len(bids),
+                        source_count=count,
                         impressions=keyword_impressions[text],
-                        source_bids=bids,
                     )
                 )
 
-            # Sort by impressions descending (most popular keywords first)
-            keyword_plans.sort(key=lambda k: k.impressions, reverse=True)
             console.print()
 
             # Step 4: Build campaign plan
@@ -770,7 +1328,6 @@ def expand_campaign(
 
             # Create ad group plans (SKAG structure)
             ad_group_plans: list[AdGroupPlan] = []
-            all_keywords = [kp.text for kp in keyword_plans]
 
             for kp in keyword_plans:
                 # Ad group name: "Exact - {keyword}"
@@ -778,14 +1335,10 @@ def expand_campaign(
                 if len(ag_name) > 200:
                     ag_name = ag_name[:197] + "..."
 
-                # Cross-negatives: all other keywords
-                negatives = [k for k in all_keywords if k != kp.text] if not skip_negatives else []
-
                 ad_group_plans.append(
                     AdGroupPlan(
                         name=ag_name,
                         keyword=kp,
-                        negatives=negatives,
                     )
                 )
 
@@ -796,7 +1349,10 @@ def expand_campaign(
                 daily_budget=plan_budget,
                 currency=currency,
                 ad_groups=ad_group_plans,
+                # Cross-negatives: held once at campaign level, derived per ad group at upload time
+                all_keywords=frozenset(kp.text for kp in keyword_plans) if not skip_negatives else frozenset(),
             )
+            total_ad_groups = len(campaign_plan.ad_groups)
 
             # Step 5: Display plan
             console.print()
@@ -810,18 +1366,11 @@ def expand_campaign(
             table.add_row("Campaign Name", campaign_plan.name)
             table.add_row("Target Country", campaign_plan.country)
             table.add_row("Daily Budget", f"{campaign_plan.daily_budget:.2f} {campaign_plan.currency}")
-            table.add_row("Ad Groups", str(len(campaign_plan.ad_groups)))
+            table.add_row("Ad Groups", str(total_ad_groups))
             table.add_row("Status", "PAUSED" if paused else "ENABLED")
             if not skip_negatives:
-                total_negatives = sum(len(ag.negatives) for ag in campaign_plan.ad_groups)
-                table.add_row("Cross-Negatives", str(total_negatives))
-            console.print(table)
-            console.print()
-
+                table.add_row("Cross-Negatives", str(campaign_plan.total_negatives))
             # Ad group details
-            console.print("[bold]Ad Groups & Keywords (sorted by impressions):[/bold]")
-            console.print()
-
             ag_table = Table(show_header=True, header_style="bold")
             ag_table.add_column("#", justify="right", style="dim")
             ag_table.add_column("Ad Group")
@@ -829,123 +1378,215 @@ def expand_campaign(
             ag_table.add_column("Bid", justify="right")
             ag_table.add_column("Impr (90d)", justify="right")
 
-            for i, ag in enumerate(campaign_plan.ad_groups[:20], 1):  # Show first 20
+            # Only the busiest keywords are shown, so pick them without sorting the whole plan
+            top_ad_groups = heapq.nlargest(
+                PLAN_PREVIEW_ROWS, campaign_plan.ad_groups, key=lambda ag: ag.keyword.impressions
+            )
+            for i, ag in enumerate(top_ad_groups, 1):
                 ag_table.add_row(
                     str(i),
-                    ag.name[:30] + ("..." if len(ag.name) > 30 else ""),
+                    ag.display_name,
                     ag.keyword.text,
                     f"{ag.keyword.bid:.2f} {ag.keyword.currency}",
                     f"{ag.keyword.impressions:,}",
                 )
 
-            if len(campaign_plan.ad_groups) > 20:
+            if total_ad_groups > PLAN_PREVIEW_ROWS:
                 ag_table.add_row(
                     "...",
-                    f"[dim]... and {len(campaign_plan.ad_groups) - 20} more[/dim]",
+                    f"[dim]... and {total_ad_groups - PLAN_PREVIEW_ROWS} more[/dim]",
                     "",
                     "",
                     "",
                 )
 
-            console.print(ag_table)
-            console.print()
+            console.print(
+                Group(
+                    table,
+                    "",
+                    "[bold]Ad Groups & Keywords (sorted by impressions):[/bold]",
+                    "",
+                    ag_table,
+                    "",
+                )
+            )
+
+            # Catch values the API would reject before anything is created
+            problems = _plan_problems(campaign_plan)
+            if problems:
+                details = "\n".join(f"• {p}" for p in problems[:MAX_PLAN_PROBLEMS])
+                if len(problems) > MAX_PLAN_PROBLEMS:
+                    details += f"\n... and {len(problems) - MAX_PLAN_PROBLEMS} more"
+                print_error("Invalid Plan", "The campaign can't be created as planned", details)
+                raise typer.Exit(1)
 
             if dry_run:
                 print_info("Dry run mode - no changes will be made")
                 return
 
             # Step 6: Confirm and create
-            if not typer.confirm("Create this campaign?", default=True):
+            if not confirm_action("Create this campaign?", default=True):
                 print_info("Cancelled")
                 return
 
             console.print()
 
             # Create campaign
+            # Shared by every creation request so rate limits back off all of them together
+            limiter = RateLimiter(CREATE_RATE_LIMIT)
+
             with spinner("Creating campaign..."):
-                new_campaign = client.campaigns.create(
-                    CampaignCreate(
-                        name=campaign_plan.name,
-                        adam_id=campaign_plan.adam_id,
-                        countries_or_regions=[campaign_plan.country],
-                        daily_budget_amount=Money(
-                            amount=str(campaign_plan.daily_budget),
-                            currency=campaign_plan.currency,
+                new_campaign = call_with_backoff(
+                    partial(
+                        client.campaigns.create,
+                        CampaignCreate(
+                            name=campaign_plan.name,
+                            adam_id=campaign_plan.adam_id,
+                            countries_or_regions=[campaign_plan.country],
+                            daily_budget_amount=Money(
+                                amount=format(campaign_plan.daily_budget, "f"),
+                                currency=campaign_plan.currency,
+                            ),
+                            supply_sources=[CampaignSupplySource.APPSTORE_SEARCH_RESULTS],
+                            status=CampaignStatus.PAUSED if paused else CampaignStatus.ENABLED,
                         ),
-                        supply_sources=[CampaignSupplySource.APPSTORE_SEARCH_RESULTS],
-                        status=CampaignStatus.PAUSED if paused else CampaignStatus.ENABLED,
-                    )
+                    ),
+                    limiter,
                 )
 
             print_success(f"Created campaign: {new_campaign.name} (ID: {new_campaign.id})")
 
             # Wait for campaign to be available
-            wait_for_resource(
-                lambda: client.campaigns.get(new_campaign.id),
-                max_attempts=10,
-                delay=0.5,
-            )
+            wait_for_resource(lambda: client.campaigns.get(new_campaign.id))
 
             # Create ad groups with keywords and negatives
             created_ad_groups = 0
             created_keywords = 0
             created_negatives = 0
+            failed_ad_groups = 0
+            failed_keywords = 0
+            failed_negatives = 0
+
+            print_info(f"Creating {total_ad_groups} ad groups...")
+
+            campaign_res = client.campaigns(new_campaign.id)
+            ad_groups_res = campaign_res.ad_groups
+
+            def build_payloads(ag_plan: AdGroupPlan) -> tuple[AdGroupCreate, KeywordCreate]:
+                """Build the ad group and keyword requests for one planned ad group."""
+                # Formatted once and shared by the ad group default bid and the keyword bid
+                bid = Money(amount=format(ag_plan.keyword.bid, "f"), currency=ag_plan.keyword.currency)
+                return (
+                    AdGroupCreate(name=ag_plan.name, default_bid_amount=bid, automated_keywords_opt_in=False),
+                    KeywordCreate(text=ag_plan.keyword.text, match_type=KeywordMatchType.EXACT, bid_amount=bid),
+                )
 
-            print_info(f"Creating {len(campaign_plan.ad_groups)} ad groups...")
-
-            for i, ag_plan in enumerate(campaign_plan.ad_groups, 1):
-                # Create ad group
-                with spinner(f"[{i}/{len(campaign_plan.ad_groups)}] Creating ad group: {ag_plan.name[:30]}..."):
-                    new_ag = client.campaigns(new_campaign.id).ad_groups.create(
-                        AdGroupCreate(
-                            name=ag_plan.name,
-                            default_bid_amount=Money(
-                                amount=str(ag_plan.keyword.bid),
-                                currency=ag_plan.keyword.currency,
-                            ),
-                            automated_keywords_opt_in=False,
-                        )
+            def create_ad_group(
+                payloads: tuple[AdGroupCreate, KeywordCreate],
+            ) -> tuple[Any, AppleSearchAdsError | None]:
+                """Create one ad group with its keyword.
+
+                Returns the new ad group and, if its keyword could not be added, the error.
+                """
+                ad_group_payload, keyword_payload = payloads
+                new_ag = call_with_backoff(partial(ad_groups_res.create, ad_group_payload), limiter)
+
+                # Create keyword (must use bulk endpoint); the ad group already exists at this
+                # point, so a failure is returned rather than reported as a failed ad group
+                try:
+                    call_with_backoff(
+                        partial(campaign_res.ad_groups(new_ag.id).keywords.create_bulk, [keyword_payload]),
+                        limiter,
                     )
+                except AppleSearchAdsError as e:
+                    return new_ag, e
+                return new_ag, None
+
+            def add_negatives(ad_group_id: int, keyword: str) -> tuple[int, int]:
+                """Add an ad group's cross-negatives.
+
+                Returns the number of negatives created and the number that failed.
+                """
+                neg_resource = campaign_res.ad_groups(ad_group_id).negative_keywords
+                negatives_created = 0
+                negatives_failed = 0
+                # Large keyword sets are sent in fixed-size batches to keep request bodies bounded;
+                # only one batch of payloads exists at a time
+                for texts in batched(campaign_plan.negatives_for(keyword), NEGATIVE_BATCH_SIZE, strict=False):
+                    batch = [NegativeKeywordCreate(text=text, match_type=KeywordMatchType.EXACT) for text in texts]
+                    try:
+                        result = call_with_backoff(partial(neg_resource.create_bulk, batch), limiter)
+                        negatives_created += len(result.data)
+                    except AppleSearchAdsError:
+                        # Keep going, but report the shortfall in the summary
+                        negatives_failed += len(batch)
+                return negatives_created, negatives_failed
+
+            # Stage 1: ad groups are independent, so create them (with their keyword) concurrently
+            negative_jobs: list[tuple[int, str]] = []
+            with create_progress() as progress, ThreadPoolExecutor(max_workers=concurrency) as executor:
+                task = progress.add_task("Creating ad groups...", total=total_ad_groups)
+                # The API has no bulk ad group endpoint, so requests are validated up front
+                # and then sent concurrently
+                payloads = [(ag_plan, build_payloads(ag_plan)) for ag_plan in campaign_plan.ad_groups]
+                creations = {executor.submit(create_ad_group, request): ag_plan for ag_plan, request in payloads}
+
+                for future in as_completed(creations):
+                    progress.advance(task)
+                    try:
+                        new_ag, keyword_error = future.result()
+                    except AppleSearchAdsError as e:
+                        # One failed ad group shouldn't abandon the ones already in flight
+                        failed_ad_groups += 1
+                        print_warning(f"Could not create ad group {creations[future].name}: {e.message}")
+                        continue
                     created_ad_groups += 1
-
-                print_success(f"[{i}/{len(campaign_plan.ad_groups)}] Created ad group: {new_ag.name} (ID: {new_ag.id})")
-
-                # Create keyword (must use bulk endpoint)
-                client.campaigns(new_campaign.id).ad_groups(new_ag.id).keywords.create_bulk(
-                    [
-                        KeywordCreate(
-                            text=ag_plan.keyword.text,
-                            match_type=KeywordMatchType.EXACT,
-                            bid_amount=Money(
-                                amount=str(ag_plan.keyword.bid),
-                                currency=ag_plan.keyword.currency,
-                            ),
+                    if keyword_error is not None:
+                        # Left without a keyword or negatives, so name it for clean-up
+                        failed_keywords += 1
+                        print_warning(
+                            f"Created ad group {new_ag.name} (ID: {new_ag.id}) "
+                            f"but its keyword could not be added: {keyword_error.message}"
                         )
+                        continue
+                    created_keywords += 1
+                    # Shown in place on the progress bar rather than printing a line per ad group
+                    progress.update(task, description=f"Created {escape(new_ag.name)}")
+
+                    # Payloads are built lazily in stage 2 so all negatives are never held at once
+                    if campaign_plan.all_keywords:
+                        negative_jobs.append((new_ag.id, creations[future].keyword.text))
+
+                progress.update(task, description=f"Created {created_ad_groups} ad groups")
+
+            # Stage 2: fan out all negative keyword batches across ad groups. Campaign-level
+            # negatives would take one request, but they would also block each ad group's own
+            # keyword, so cross-negatives have to be added per ad group.
+            if negative_jobs:
+                with create_progress() as progress, ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    task = progress.add_task("Adding cross-negatives...", total=len(negative_jobs))
+                    submissions = [
+                        executor.submit(add_negatives, ad_group_id, keyword) for ad_group_id, keyword in negative_jobs
                     ]
-                )
-                created_keywords += 1
 
-                # Create negative keywords (bulk for efficiency)
-                if ag_plan.negatives:
-                    try:
-                        neg_keywords = [
-                            NegativeKeywordCreate(
-                                text=neg_text,
-                                match_type=KeywordMatchType.EXACT,
-                            )
-                            for neg_text in ag_plan.negatives
-                        ]
-                        neg_resource = client.campaigns(new_campaign.id).ad_groups(new_ag.id).negative_keywords
-                        result = neg_resource.create_bulk(neg_keywords)
-                        created_negatives += len(result.data)
-                    except AppleSearchAdsError:
-                        # Skip if negative keyword creation fails
-                        pass
+                    for future in as_completed(submissions):
+                        negatives_created, negatives_failed = future.result()
+                        created_negatives += negatives_created
+                        failed_negatives += negatives_failed
+                        progress.advance(task)
+
+            if failed_ad_groups:
+                print_warning(f"{failed_ad_groups} ad groups could not be created")
+            if failed_keywords:
+                print_warning(f"{failed_keywords} ad groups were created without their keyword")
+            if failed_negatives:
+                print_warning(f"{failed_negatives} negative keywords could not be created")
 
             # Summary
             console.print()
+            failed = failed_ad_groups or failed_keywords or failed_negatives
             print_result_panel(
-                "Campaign Created Successfully",
+                "Campaign Created with Errors" if failed else "Campaign Created Successfully",
                 {
                     "Campaign ID": str(new_campaign.id),
                     "Campaign Name": new_campaign.name,
@@ -953,8 +1594,10 @@ def expand_campaign(
                     "Ad Groups": str(created_ad_groups),
                     "Keywords": str(created_keywords),
                     "Negative Keywords": str(created_negatives),
+                    "Concurrency": str(concurrency),
                     "Status": "PAUSED" if paused else "ENABLED",
                 },
+                style="warning" if failed else "success",
             )
 
     except AppleSearchAdsError as e:
@@ -962,7 +1605,37 @@ def expand_campaign(
         raise typer.Exit(1) from None
 
 
-@dataclass
+# Bid strength by (impressions bucket, TTR bucket); each bucket is
+# (value >= high) << 1 | (value >= low), so 0 = low, 1 = mid, 3 = high
+_STRENGTH_TABLE: dict[tuple[int, int], str] = {
+    (3, 3): "STRONG",
+    (3, 1): "MODERATE",
+    (3, 0): "WEAK",
+    (1, 3): "MODERATE",
+    (1, 1): "MODERATE",
+    (1, 0): "WEAK",
+    (0, 3): "WEAK",
+    (0, 1): "WEAK",
+    (0, 0): "WEAK",
+}
+
+_RECOMMENDATIONS: dict[str, str] = {
+    "STRONG": "Consider increase for more volume",
+    "MODERATE": "Monitor performance",
+    "WEAK": "Increase bid or review keyword",
+    "UNKNOWN": "Need more data",
+}
+
+
+# Color-coded strength labels for the bid-review table
+_STRENGTH_TAGS: dict[str, str] = {
+    "STRONG": "[green]STRONG[/green]",
+    "MODERATE": "[yellow]MODERATE[/yellow]",
+    "WEAK": "[red]WEAK[/red]",
+}
+
+
+@dataclass(slots=True)
 class KeywordBidAnalysis:
     """Analysis of a keyword's bid performance."""
 
@@ -972,19 +1645,20 @@ class KeywordBidAnalysis:
     ad_group_name: str
     keyword_id: int
     keyword_text: str
-    current_bid: Decimal
+    current_bid: float
     currency: str
     impressions: int
     taps: int
     conversions: int
-    spend: Decimal
-    avg_cpt: Decimal | None  # Average cost per tap
+    spend: float
+    avg_cpt: float | None  # Average cost per tap
     ttr: float | None  # Tap-through rate
     cr: float | None  # Conversion rate
     country: str
+    bid_strength: str = field(init=False)
+    recommendation: str = field(init=False)
 
-    @property
-    def bid_strength(self) -> str:
+    def __post_init__(self) -> None:
         """Estimate bid strength based on performance metrics.
 
         Since Apple doesn't expose bidStrength via API, we estimate:
@@ -992,31 +1666,169 @@ class KeywordBidAnalysis:
         - MODERATE: Decent impressions, average TTR
         - WEAK: Low impressions or poor TTR
         """
-        if self.impressions == 0:
-            return "UNKNOWN"
+        if self.impressions <= 0:
+            self.bid_strength = "UNKNOWN"
+        else:
+            ttr = self.ttr or 0
+            impressions_bucket = (self.impressions >= 1000) << 1 | (self.impressions >= 100)
+            ttr_bucket = (ttr >= 0.05) << 1 | (ttr >= 0.02)
+            self.bid_strength = _STRENGTH_TABLE[impressions_bucket, ttr_bucket]
+        self.recommendation = _RECOMMENDATIONS[self.bid_strength]
+
+
+BID_REVIEW_CSV_COLUMNS = [
+    "campaign_name",
+    "ad_group_name",
+    "keyword",
+    "country",
+    "current_bid",
+    "currency",
+    "impressions",
+    "taps",
+    "conversions",
+    "spend",
+    "avg_cpt",
+    "ttr",
+    "cr",
+    "bid_strength",
+    "recommendation",
+]
+
+
+def _bid_review_csv_row(k: KeywordBidAnalysis) -> list[Any]:
+    """Build a bid-review CSV row for a keyword analysis."""
+    return [
+        k.campaign_name,
+        k.ad_group_name,
+        k.keyword_text,
+        k.country,
+        f"{k.current_bid:.2f}",
+        k.currency,
+        k.impressions,
+        k.taps,
+        k.conversions,
+        f"{k.spend:.2f}",
+        f"{k.avg_cpt:.2f}" if k.avg_cpt is not None else "",
+        f"{k.ttr:.4f}" if k.ttr else "",
+        f"{k.cr:.4f}" if k.cr else "",
+        k.bid_strength,
+        k.recommendation,
+    ]
+
+
+def _is_active_keyword_row(row: Any) -> bool:
+    """Check whether a keyword report row is an active keyword in an enabled ad group.
 
-        # Calculate TTR if we have data
-        ttr = self.ttr or 0
+    Args:
+        row: A row from a keyword report.
 
-        if self.impressions >= 1000 and ttr >= 0.05:
-            return "STRONG"
-        elif self.impressions >= 100 and ttr >= 0.02:
-            return "MODERATE"
-        elif self.impressions > 0:
-            return "WEAK"
-        return "UNKNOWN"
+    Returns:
+        True if the row has metrics and can be analyzed and updated.
+    """
+    if not row.metadata.keyword or not row.total:
+        return False
+    # Skip if no ad_group_id (needed for updates)
+    if not row.metadata.ad_group_id:
+        return False
+    # Skip paused/deleted keywords and ad groups
+    if row.metadata.keyword_status and enum_value(row.metadata.keyword_status) != "ACTIVE":
+        return False
+    return not (row.metadata.ad_group_status and enum_value(row.metadata.ad_group_status) != "ENABLED")
+
+
+def _iter_keyword_analyses(
+    campaign: Any,
+    report: Any,
+    min_impressions: int = 0,
+    weak_only: bool = False,
+) -> Iterator[KeywordBidAnalysis]:
+    """Yield a bid analysis for each active keyword row in a keyword report.
+
+    Rows that are certain to be filtered out (no impressions, below
+    ``min_impressions``, or not weak when ``weak_only``) are skipped before
+    any analysis object is built.
 
-    @property
-    def recommendation(self) -> str:
-        """Suggest bid adjustment based on performance."""
-        strength = self.bid_strength
-        if strength == "STRONG":
-            return "Consider increase for more volume"
-        elif strength == "MODERATE":
-            return "Monitor performance"
-        elif strength == "WEAK":
-            return "Increase bid or review keyword"
-        return "Need more data"
+    Args:
+        campaign: The campaign the report belongs to.
+        report: The keyword report for that campaign.
+        min_impressions: Minimum impressions to include.
+        weak_only: Only yield keywords that will classify as WEAK.
+
+    Yields:
+        KeywordBidAnalysis for each usable row.
+    """
+    campaign_country = campaign.countries_or_regions[0] if campaign.countries_or_regions else "?"
+
+    for row in report.row:
+        if not _is_active_keyword_row(row):
+            continue
+
+        impressions = row.total.impressions or 0
+        taps = row.total.taps or 0
+
+        # Cheap pre-checks: zero impressions is always UNKNOWN, and WEAK means
+        # fewer than 100 impressions or a TTR under 2%
+        if impressions <= 0 or impressions < min_impressions:
+            continue
+        if weak_only and impressions >= 100 and taps / impressions >= 0.02:
+            continue
+
+        conversions = row.total.installs or 0
+        # Read-only metrics stay as floats; Decimal is only needed when writing bids back
+        spend = float(row.total.local_spend.amount) if row.total.local_spend else 0.0
+        currency = row.total.local_spend.currency if row.total.local_spend else "USD"
+
+        # Calculate metrics
+        avg_cpt = spend / taps if taps > 0 else None
+        ttr = taps / impressions if impressions > 0 else None
+        cr = conversions / taps if taps > 0 else None
+
+        # Get current bid from metadata
+        bid = float(row.metadata.bid_amount.amount) if row.metadata.bid_amount else 0.0
+
+        yield KeywordBidAnalysis(
+            campaign_id=campaign.id,
+            campaign_name=campaign.name,
+            ad_group_id=row.metadata.ad_group_id or 0,
+            ad_group_name=row.metadata.ad_group_name or "",
+            keyword_id=row.metadata.keyword_id or 0,
+            keyword_text=row.metadata.keyword,
+            current_bid=bid,
+            currency=currency,
+            impressions=impressions,
+            taps=taps,
+            conversions=conversions,
+            spend=spend,
+            avg_cpt=avg_cpt,
+            ttr=ttr,
+            cr=cr,
+            country=campaign_country,
+        )
+
+
+def _apply_bid_action(action: str, bid: Decimal) -> Decimal:
+    """Compute a new bid from an interactive bid-review answer.
+
+    Args:
+        action: An absolute bid ("2.50") or an increase ("+0.50", "+20%").
+        bid: The bid an increase is applied to.
+
+    Returns:
+        The new bid.
+
+    Raises:
+        ArithmeticError: If the answer isn't a finite number.
+    """
+    if action.startswith("+"):
+        if action.endswith("%"):
+            new_bid = round(bid * (1 + Decimal(action[1:-1]) / 100), 2)
+        else:
+            new_bid = bid + Decimal(action[1:])
+    else:
+        new_bid = Decimal(action)
+    if not new_bid.is_finite():
+        raise InvalidOperation(action)
+    return new_bid
 
 
 @app.command("bid-review")
@@ -1049,6 +1861,10 @@ def review_keyword_bids(
         bool,
         typer.Option("--interactive", "-i", help="Interactive mode to adjust bids"),
     ] = False,
+    refresh: Annotated[
+        bool,
+        typer.Option("--refresh", help="Ignore cached campaigns and reports and fetch fresh data"),
+    ] = False,
 ) -> None:
     """Review keyword bids and their performance.
 
@@ -1067,6 +1883,7 @@ def review_keyword_bids(
         asa optimize bid-review --days 14 --min-impressions 100
         asa optimize bid-review --output keywords.csv
         asa optimize bid-review --weak --interactive  # Interactively increase weak bids
+        asa optimize bid-review --refresh  # Bypass the local campaign and report cache
     """
     client = get_client()
 
@@ -1077,7 +1894,9 @@ def review_keyword_bids(
         with client:
             # Get enabled campaigns
             with spinner("Loading campaigns..."):
-                campaigns = list(client.campaigns.find(Selector().where("status", "==", "ENABLED")))
+                campaigns = _cached_campaigns(
+                    client, Selector().where("status", "==", "ENABLED"), use_cache=not refresh
+                )
 
             if country:
                 country = country.upper()
@@ -1089,148 +1908,85 @@ def review_keyword_bids(
 
             print_info(f"Analyzing {len(campaigns)} campaigns...")
 
-            # Collect keyword performance data
-            keyword_analyses: list[KeywordBidAnalysis] = []
-
-            for campaign in campaigns:
-                campaign_country = campaign.countries_or_regions[0] if campaign.countries_or_regions else "?"
-
-                with spinner(f"Fetching keyword data for {campaign.name[:30]}..."):
+            # Stream analyses straight into the CSV, the counters and a bounded
+            # top-N heap instead of holding every keyword in memory
+            by_impressions = attrgetter("impressions")
+            strength_counts: Counter[str] = Counter()
+            adjustable: list[KeywordBidAnalysis] = []
+            total_found = 0
+            matched = 0
+
+            with ExitStack() as stack:
+                writer = None
+                if output:
                     try:
-                        # Get keyword report
-                        report = client.reports.keywords(
-                            campaign_id=campaign.id,
-                            start_date=start_date,
-                            end_date=end_date,
-                            granularity=GranularityType.DAILY,
-                        )
-
-                        for row in report.row:
-                            if not row.metadata.keyword or not row.total:
-                                continue
-                            # Skip if no ad_group_id (needed for updates)
-                            if not row.metadata.ad_group_id:
-                                continue
-                            # Skip paused/deleted keywords and ad groups
-                            if row.metadata.keyword_status and enum_value(row.metadata.keyword_status) != "ACTIVE":
-                                continue
-                            if row.metadata.ad_group_status and enum_value(row.metadata.ad_group_status) != "ENABLED":
-                                continue
-
-                            impressions = row.total.impressions or 0
-                            taps = row.total.taps or 0
-                            conversions = row.total.installs or 0
-                            spend_amount = row.total.local_spend.amount if row.total.local_spend else "0"
-                            spend = Decimal(str(spend_amount))
-                            currency = row.total.local_spend.currency if row.total.local_spend else "USD"
-
-                            # Calculate metrics
-                            avg_cpt = spend / taps if taps > 0 else None
-                            ttr = taps / impressions if impressions > 0 else None
-                            cr = conversions / taps if taps > 0 else None
-
-                            # Get current bid from metadata
-                            bid_amount = row.metadata.bid_amount.amount if row.metadata.bid_amount else "0"
-                            bid = Decimal(str(bid_amount))
-
-                            keyword_analyses.append(
-                                KeywordBidAnalysis(
-                                    campaign_id=campaign.id,
-                                    campaign_name=campaign.name,
-                                    ad_group_id=row.metadata.ad_group_id or 0,
-                                    ad_group_name=row.metadata.ad_group_name or "",
-                                    keyword_id=row.metadata.keyword_id or 0,
-                                    keyword_text=row.metadata.keyword,
-                                    current_bid=bid,
-                                    currency=currency,
-                                    impressions=impressions,
-                                    taps=taps,
-                                    conversions=conversions,
-                                    spend=spend,
-                                    avg_cpt=avg_cpt,
-                                    ttr=ttr,
-                                    cr=cr,
-                                    country=campaign_country,
-                                )
-                            )
-
+                        csv_file = stack.enter_context(open(output, "w", newline="", buffering=1 << 20))
+                        writer = csv.writer(csv_file)
+                        writer.writerow(BID_REVIEW_CSV_COLUMNS)
+                    except OSError as e:
+                        print_error("Export failed", str(e))
+
+                progress = stack.enter_context(create_progress())
+                task = progress.add_task("Fetching keyword data...", total=len(campaigns))
+
+                # Reports are independent, so fetch them concurrently and process as they arrive
+                executor = stack.enter_context(ThreadPoolExecutor(max_workers=min(REPORT_WORKERS, len(campaigns))))
+                futures = {
+                    executor.submit(
+                        _cached_keyword_report,
+                        client,
+                        campaign_id=campaign.id,
+                        start_date=start_date,
+                        end_date=end_date,
+                        refresh=refresh,
+                    ): campaign
+                    for campaign in campaigns
+                }
+
+                # Min-heap of the most-viewed keywords for display; the arrival number
+                # breaks ties so earlier keywords are kept, and analyses are never compared
+                top: list[tuple[int, int, KeywordBidAnalysis]] = []
+                for future in as_completed(futures):
+                    campaign = futures[future]
+                    progress.advance(task)
+                    try:
+                        report = future.result()
                     except AppleSearchAdsError:
                         continue
 
-            if not keyword_analyses:
-                print_warning("No keyword data found")
-                return
+                    total_found += sum(1 for row in report.row if _is_active_keyword_row(row))
+                    # Matches are buffered per report so the CSV gets one writerows call each
+                    batch = list(_iter_keyword_analyses(campaign, report, min_impressions, weak_only))
+                    for k in batch:
+                        strength = k.bid_strength
+                        strength_counts[strength] += 1
+                        if interactive and strength in ("WEAK", "MODERATE"):
+                            adjustable.append(k)
+                        if limit > 0:
+                            entry = (k.impressions, -matched, k)
+                            if len(top) < limit:
+                                heapq.heappush(top, entry)
+                            else:
+                                heapq.heappushpop(top, entry)
+                        matched += 1
 
-            # Apply filters
-            # Filter out keywords with no data (UNKNOWN strength)
-            keyword_analyses = [k for k in keyword_analyses if k.bid_strength != "UNKNOWN"]
+                    if writer:
+                        writer.writerows(_bid_review_csv_row(k) for k in batch)
 
-            if min_impressions > 0:
-                keyword_analyses = [k for k in keyword_analyses if k.impressions >= min_impressions]
+                top_analyses = [k for _, _, k in sorted(top, reverse=True)]
 
-            if weak_only:
-                keyword_analyses = [k for k in keyword_analyses if k.bid_strength == "WEAK"]
+            if not total_found:
+                print_warning("No keyword data found")
+                return
 
-            if not keyword_analyses:
+            if not matched:
                 print_warning("No keywords match the specified filters")
                 return
 
-            # Sort by impressions (most first)
-            keyword_analyses.sort(key=lambda k: k.impressions, reverse=True)
-
-            # Export to CSV if requested
-            if output:
-                try:
-                    import csv
-
-                    with open(output, "w", newline="") as f:
-                        writer = csv.writer(f)
-                        writer.writerow(
-                            [
-                                "campaign_name",
-                                "ad_group_name",
-                                "keyword",
-                                "country",
-                                "current_bid",
-                                "currency",
-                                "impressions",
-                                "taps",
-                                "conversions",
-                                "spend",
-                                "avg_cpt",
-                                "ttr",
-                                "cr",
-                                "bid_strength",
-                                "recommendation",
-                            ]
-                        )
-                        for k in keyword_analyses:
-                            writer.writerow(
-                                [
-                                    k.campaign_name,
-                                    k.ad_group_name,
-                                    k.keyword_text,
-                                    k.country,
-                                    k.current_bid,
-                                    k.currency,
-                                    k.impressions,
-                                    k.taps,
-                                    k.conversions,
-                                    k.spend,
-                                    k.avg_cpt,
-                                    f"{k.ttr:.4f}" if k.ttr else "",
-                                    f"{k.cr:.4f}" if k.cr else "",
-                                    k.bid_strength,
-                                    k.recommendation,
-                                ]
-                            )
-                    print_success(f"Exported {len(keyword_analyses)} keywords to {output}")
-                except Exception as e:
-                    print_error("Export failed", str(e))
+            if writer:
+                print_success(f"Exported {matched} keywords to {output}")
 
             # Display table
-            display_count = min(limit, len(keyword_analyses))
-
             table = Table(title=f"Keyword Bid Review ({days} days)")
             table.add_column("Keyword", style="cyan", max_width=25)
             table.add_column("Campaign", style="magenta", max_width=20)
@@ -1240,54 +1996,47 @@ def review_keyword_bids(
             table.add_column("TTR", justify="right", width=6)
             table.add_column("Strength", justify="center", width=10)
 
-            for k in keyword_analyses[:display_count]:
-                # Color code strength
-                strength = k.bid_strength
-                if strength == "STRONG":
-                    strength_display = "[green]STRONG[/green]"
-                elif strength == "MODERATE":
-                    strength_display = "[yellow]MODERATE[/yellow]"
-                elif strength == "WEAK":
-                    strength_display = "[red]WEAK[/red]"
-                else:
-                    strength_display = "[dim]?[/dim]"
-
-                ttr_display = f"{k.ttr * 100:.1f}%" if k.ttr else "—"
-
-                table.add_row(
+            rows = [
+                (
                     k.keyword_text[:25],
                     k.campaign_name[:20],
                     k.country,
                     f"{k.current_bid:.2f}",
                     f"{k.impressions:,}",
-                    ttr_display,
-                    strength_display,
+                    f"{k.ttr * 100:.1f}%" if k.ttr else "—",
+                    _STRENGTH_TAGS.get(k.bid_strength, "[dim]?[/dim]"),
                 )
+                for k in top_analyses
+            ]
+            for row in rows:
+                table.add_row(*row)
 
             console.print(table)
 
-            if len(keyword_analyses) > display_count:
-                print_info(f"Showing {display_count} of {len(keyword_analyses)} keywords. Use --limit to see more.")
+            if matched > len(top_analyses):
+                print_info(f"Showing {len(top_analyses)} of {matched} keywords. Use --limit to see more.")
 
             # Summary
-            strong = sum(1 for k in keyword_analyses if k.bid_strength == "STRONG")
-            moderate = sum(1 for k in keyword_analyses if k.bid_strength == "MODERATE")
-            weak = sum(1 for k in keyword_analyses if k.bid_strength == "WEAK")
-
-            console.print("\n[dim]Bid Strength Summary:[/dim]")
-            console.print(f"  [green]Strong:[/green] {strong}")
-            console.print(f"  [yellow]Moderate:[/yellow] {moderate}")
-            console.print(f"  [red]Weak:[/red] {weak}")
-
+            strong = strength_counts["STRONG"]
+            moderate = strength_counts["MODERATE"]
+            weak = strength_counts["WEAK"]
+
+            summary_lines = [
+                "\n[dim]Bid Strength Summary:[/dim]",
+                f"  [green]Strong:[/green] {strong}",
+                f"  [yellow]Moderate:[/yellow] {moderate}",
+                f"  [red]Weak:[/red] {weak}",
+            ]
             if weak > 0:
-                console.print(
+                summary_lines.append(
                     f"\n[yellow]💡 {weak} keywords have weak bid strength - consider increasing bids[/yellow]"
                 )
+            console.print("\n".join(summary_lines))
 
             # Interactive mode for bid adjustments
             if interactive:
-                # Filter to weak/moderate keywords for interactive adjustment
-                adjustable = [k for k in keyword_analyses if k.bid_strength in ("WEAK", "MODERATE")]
+                # Weak/moderate keywords were collected while streaming; review the busiest first
+                adjustable.sort(key=by_impressions, reverse=True)
 
                 if not adjustable:
                     print_info("No weak or moderate keywords to adjust")
@@ -1296,11 +2045,12 @@ def review_keyword_bids(
                 console.print()
                 console.rule("[bold]Interactive Bid Adjustment")
                 console.print()
-                console.print("[dim]For each keyword, choose an action:[/dim]")
-                console.print("[dim]  • Enter a number to set new bid (e.g., '2.50')[/dim]")
-                console.print("[dim]  • +N or +N% to increase (e.g., '+0.50' or '+20%')[/dim]")
-                console.print("[dim]  • 's' to skip, 'q' to quit[/dim]")
-                console.print()
+                console.print(
+                    "[dim]For each keyword, choose an action:[/dim]\n"
+                    "[dim]  • Enter a number to set new bid (e.g., '2.50')[/dim]\n"
+                    "[dim]  • +N or +N% to increase (e.g., '+0.50' or '+20%')[/dim]\n"
+                    "[dim]  • 's' to skip, 'q' to quit[/dim]\n"
+                )
 
                 changes_made = 0
                 for i, kw in enumerate(adjustable, 1):
@@ -1313,28 +2063,26 @@ def review_keyword_bids(
 
                     # Show keyword details
                     strength_color = "red" if kw.bid_strength == "WEAK" else "yellow"
-                    console.print(f"[bold]Keyword:[/bold] {kw.keyword_text} [dim]ID: {kw.keyword_id}[/dim]")
-                    console.print(
-                        f"[bold]Campaign:[/bold] {kw.campaign_name} ({kw.country}) [dim]ID: {kw.campaign_id}[/dim]"
-                    )
-                    console.print(f"[bold]Ad Group:[/bold] {kw.ad_group_name} [dim]ID: {kw.ad_group_id}[/dim]")
-                    console.print()
-                    console.print(
-                        f"  Current bid:     [{strength_color}]{kw.current_bid:.2f} {kw.currency}[/{strength_color}]"
-                    )
-                    console.print(f"  Impressions:     {kw.impressions:,}")
                     ttr_display = f"{kw.ttr * 100:.1f}%" if kw.ttr else "—"
-                    console.print(f"  TTR:             {ttr_display}")
-                    console.print(f"  Strength:        [{strength_color}]{kw.bid_strength}[/{strength_color}]")
+                    detail_lines = [
+                        f"[bold]Keyword:[/bold] {kw.keyword_text} [dim]ID: {kw.keyword_id}[/dim]",
+                        f"[bold]Campaign:[/bold] {kw.campaign_name} ({kw.country}) [dim]ID: {kw.campaign_id}[/dim]",
+                        f"[bold]Ad Group:[/bold] {kw.ad_group_name} [dim]ID: {kw.ad_group_id}[/dim]",
+                        "",
+                        f"  Current bid:     [{strength_color}]{kw.current_bid:.2f} {kw.currency}[/{strength_color}]",
+                        f"  Impressions:     {kw.impressions:,}",
+                        f"  TTR:             {ttr_display}",
+                        f"  Strength:        [{strength_color}]{kw.bid_strength}[/{strength_color}]",
+                    ]
                     if kw.avg_cpt:
-                        console.print(f"  Avg CPT:         {kw.avg_cpt:.2f} {kw.currency}")
-                    console.print()
+                        detail_lines.append(f"  Avg CPT:         {kw.avg_cpt:.2f} {kw.currency}")
+                    detail_lines.append("")
+                    console.print("\n".join(detail_lines))
 
                     # Suggest a new bid (20% increase for weak, 10% for moderate)
-                    if kw.bid_strength == "WEAK":
-                        suggested = round(kw.current_bid * Decimal("1.20"), 2)
-                    else:
-                        suggested = round(kw.current_bid * Decimal("1.10"), 2)
+                    current_bid = Decimal(str(kw.current_bid))
+                    suggested_increase = "+20%" if kw.bid_strength == "WEAK" else "+10%"
+                    suggested = _apply_bid_action(suggested_increase, current_bid)
 
                     console.print(f"[bold]Suggested:[/bold] {suggested:.2f} {kw.currency}")
                     console.print()
@@ -1357,23 +2105,14 @@ def review_keyword_bids(
                         console.print()
                         continue
 
-                    # Parse the new bid
-                    try:
-                        if action.startswith("+"):
-                            # Relative increase
-                            if action.endswith("%"):
-                                pct = Decimal(action[1:-1]) / 100
-                                new_bid = round(kw.current_bid * (1 + pct), 2)
-                            else:
-                                new_bid = kw.current_bid + Decimal(action[1:])
-                        else:
-                            new_bid = Decimal(action)
+                    # Accepting the suggestion is an increase, applied to the live bid below
+                    if action == str(suggested):
+                        action = suggested_increase
 
-                        if new_bid <= 0:
-                            print_warning("Invalid bid (must be positive), skipping")
-                            continue
-
-                    except Exception:
+                    # Check the answer parses before fetching anything
+                    try:
+                        _apply_bid_action(action, current_bid)
+                    except ArithmeticError:
                         print_warning(f"Invalid input '{action}', skipping")
                         continue
 
@@ -1410,6 +2149,15 @@ def review_keyword_bids(
                         )
                         continue
 
+                    # The report may predate recent bid changes, so increases build on the live bid
+                    live_bid = Decimal(actual_keyword.bid_amount.amount) if actual_keyword.bid_amount else current_bid
+                    if live_bid != current_bid:
+                        print_info(f"Live bid is {live_bid:.2f} {kw.currency} (report showed {current_bid:.2f})")
+                    new_bid = _apply_bid_action(action, live_bid)
+                    if new_bid <= 0:
+                        print_warning("Invalid bid (must be positive), skipping")
+                        continue
+
                     try:
                         with spinner(f"Updating keyword {actual_keyword.id}..."):
                             # Must use bulk endpoint - Apple API doesn't support single keyword PUT
@@ -1419,7 +2167,7 @@ def review_keyword_bids(
                                         actual_keyword.id,
                                         KeywordUpdate(
                                             bid_amount=Money(
-                                                amount=str(new_bid),
+                                                amount=format(new_bid, "f"),
                                                 currency=kw.currency,
                                             )
                                         ),
@@ -1433,7 +2181,9 @@ def review_keyword_bids(
                         print_error("Update failed", str(e))
                         continue
 
-                    print_success(f"Updated: {kw.current_bid:.2f} → {new_bid:.2f} {kw.currency}")
+                    # The cached report still holds the old bid
+                    _forget_keyword_report(client, kw.campaign_id, start_date, end_date)
+                    print_success(f"Updated: {live_bid:.2f} → {new_bid:.2f} {kw.currency}")
                     changes_made += 1
                     console.print()
 
@@ -1,7 +1,8 @@
 """Report CLI commands."""
 
-import csv
-import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
 from typing import Annotated, Any
 
@@ -12,7 +13,9 @@ from rich.panel import Panel
 from rich.table import Table
 
 from asa_api_cli.utils import (
+    cached_report,
     console,
+    dump_json,
     format_number,
     format_percent,
     get_client,
@@ -34,23 +37,26 @@ def format_report_money(spend: object | None) -> str:
     return f"{spend.amount} {spend.currency}"  # type: ignore
 
 
+# Report metadata fields copied into report rows, as (model attribute, column) pairs
+_METADATA_COLUMNS = (
+    ("campaign_name", "campaign"),
+    ("ad_group_name", "ad_group"),
+    ("keyword", "keyword"),
+    ("search_term_text", "search_term"),
+    ("country_or_region", "country"),
+)
+
+
 def report_row_to_dict(row: object) -> dict[str, Any]:
     """Convert report row to display dictionary."""
     result: dict[str, Any] = {}
 
-    # Metadata
+    # Metadata, read from the model's field dict in one pass
     if row.metadata:  # type: ignore
-        meta = row.metadata  # type: ignore
-        if meta.campaign_name:
-            result["campaign"] = meta.campaign_name
-        if meta.ad_group_name:
-            result["ad_group"] = meta.ad_group_name
-        if meta.keyword:
-            result["keyword"] = meta.keyword
-        if meta.search_term_text:
-            result["search_term"] = meta.search_term_text
-        if meta.country_or_region:
-            result["country"] = meta.country_or_region
+        meta = vars(row.metadata)  # type: ignore
+        for attr, column in _METADATA_COLUMNS:
+            if value := meta.get(attr):
+                result[column] = value
 
     # Metrics
     if row.total:  # type: ignore
@@ -67,8 +73,85 @@ def report_row_to_dict(row: object) -> dict[str, Any]:
     return result
 
 
+@dataclass(slots=True)
+class _ReportRowView:
+    """Flat, slotted copy of the report row fields used for file export.
+
+    Reading each field off the nested metadata/total models once lets the
+    export address every column as a plain attribute.
+    """
+
+    campaign: str | None = None
+    ad_group: str | None = None
+    keyword: str | None = None
+    search_term: str | None = None
+    country: str | None = None
+    impressions: int | None = None
+    taps: int | None = None
+    installs: int | None = None
+    ttr: float | None = None
+    conv_rate: float | None = None
+    spend: str | None = None
+    avg_cpt: str | None = None
+    avg_cpa: str | None = None
+
+    @classmethod
+    def from_row(cls, row: Any) -> "_ReportRowView":
+        """Copy the fields of a report row."""
+        view = cls()
+        if meta := row.metadata:
+            view.campaign = meta.campaign_name
+            view.ad_group = meta.ad_group_name
+            view.keyword = meta.keyword
+            view.search_term = meta.search_term_text
+            view.country = meta.country_or_region
+        if total := row.total:
+            view.impressions = total.impressions
+            view.taps = total.taps
+            view.installs = total.installs
+            view.ttr = total.ttr
+            view.conv_rate = total.conversion_rate
+            view.spend = total.local_spend.amount if total.local_spend else None
+            view.avg_cpt = total.avg_cpt.amount if total.avg_cpt else None
+            view.avg_cpa = total.avg_cpa.amount if total.avg_cpa else None
+        return view
+
+
+# Display labels for report columns
+REPORT_COLUMN_LABELS = {
+    "campaign": "Campaign",
+    "ad_group": "Ad Group",
+    "keyword": "Keyword",
+    "search_term": "Search Term",
+    "country": "Country",
+    "impressions": "Impressions",
+    "taps": "Taps",
+    "installs": "Installs",
+    "ttr": "TTR",
+    "conv_rate": "Conv Rate",
+    "spend": "Spend",
+    "avg_cpt": "Avg CPT",
+    "avg_cpa": "Avg CPA",
+}
+
+
+def _format_cell(value: Any) -> str:
+    """Format a report cell with no special formatting."""
+    return str(value) if value else "-"
+
+
+# Cell formatters for report columns; other columns use _format_cell
+_REPORT_FORMATTERS: dict[str, Callable[[Any], str]] = {
+    "ttr": format_percent,
+    "conv_rate": format_percent,
+    "impressions": format_number,
+    "taps": format_number,
+    "installs": format_number,
+}
+
+
 def print_report_table(
-    data: list[dict[str, Any]],
+    data: Iterable[dict[str, Any]],
     columns: list[str],
     title: str,
 ) -> None:
@@ -81,39 +164,13 @@ def print_report_table(
         row_styles=["", "dim"],
     )
 
-    # Column headers
-    column_labels = {
-        "campaign": "Campaign",
-        "ad_group": "Ad Group",
-        "keyword": "Keyword",
-        "search_term": "Search Term",
-        "country": "Country",
-        "impressions": "Impressions",
-        "taps": "Taps",
-        "installs": "Installs",
-        "ttr": "TTR",
-        "conv_rate": "Conv Rate",
-        "spend": "Spend",
-        "avg_cpt": "Avg CPT",
-        "avg_cpa": "Avg CPA",
-    }
-
     for col in columns:
-        table.add_column(column_labels.get(col, col))
+        table.add_column(REPORT_COLUMN_LABELS.get(col, col))
 
+    # Resolve each column's formatter once rather than per cell
+    formatters = [(col, _REPORT_FORMATTERS.get(col, _format_cell)) for col in columns]
     for row in data:
-        values = []
-        for col in columns:
-            value = row.get(col)
-            if col in ("ttr", "conv_rate"):
-                values.append(format_percent(value))
-            elif col in ("impressions", "taps", "installs"):
-                values.append(format_number(value))
-            elif col in ("spend", "avg_cpt", "avg_cpa"):
-                values.append(str(value) if value else "-")
-            else:
-                values.append(str(value) if value else "-")
-        table.add_row(*values)
+        table.add_row(*[fmt(row.get(col)) for col, fmt in formatters])
 
     console.print(table)
 
@@ -149,20 +206,35 @@ def print_grand_totals(report: object) -> None:
 
 
 def save_report(
-    data: list[dict[str, Any]],
+    rows: Iterable[Any],
     output: Path,
     columns: list[str],
 ) -> None:
-    """Save report to file."""
+    """Save report rows to file.
+
+    Rows are written as they are read, so the whole report never has to be
+    held as a list of dicts or as one JSON string. CSV cells are read from a
+    flat view of each row without building a dict per row.
+    """
     suffix = output.suffix.lower()
 
     if suffix == ".json":
-        output.write_text(json.dumps(data, indent=2, default=str))
+        with output.open("wb") as f:
+            separator = b"[\n"
+            for row in rows:
+                f.write(separator)
+                f.write(b"  " + dump_json(report_row_to_dict(row), indent=True).replace(b"\n", b"\n  "))
+                separator = b",\n"
+            f.write(b"[]" if separator == b"[\n" else b"\n]")
     elif suffix == ".csv":
+        import csv
+
+        # attrgetter returns a bare value for a single name, so always ask for a tuple
+        cells = attrgetter(*columns) if len(columns) > 1 else lambda view: (getattr(view, columns[0]),)
         with output.open("w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
-            writer.writeheader()
-            writer.writerows(data)
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows(cells(_ReportRowView.from_row(row)) for row in rows)
     else:
         print_error("Unsupported Format", f"File format '{suffix}' is not supported", "Supported formats: .json, .csv")
         raise typer.Exit(1)
@@ -192,6 +264,10 @@ def campaign_report(
         Path | None,
         typer.Option("--output", "-o", help="Save to file (JSON or CSV)"),
     ] = None,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Always fetch the report from the API"),
+    ] = False,
 ) -> None:
     """Generate a campaign performance report.
 
@@ -209,7 +285,10 @@ def campaign_report(
     try:
         with client:
             with spinner("Generating campaign report..."):
-                report = client.reports.campaigns(
+                report = cached_report(
+                    client,
+                    "campaigns",
+                    refresh=no_cache,
                     start_date=start_date,
                     end_date=end_date,
                     campaign_ids=campaign_ids,
@@ -220,14 +299,13 @@ def campaign_report(
                 print_warning("No data found for the specified period")
                 return
 
-            data = [report_row_to_dict(row) for row in report.row]
             columns = ["campaign", "impressions", "taps", "installs", "ttr", "conv_rate", "spend"]
 
             if output:
-                save_report(data, output, columns)
+                save_report(report.row, output, columns)
             else:
                 print_report_table(
-                    data,
+                    (report_row_to_dict(row) for row in report.row),
                     columns,
                     f"Campaign Report ({start} to {end})",
                 )
@@ -257,6 +335,10 @@ def ad_group_report(
         Path | None,
         typer.Option("--output", "-o", help="Save to file (JSON or CSV)"),
     ] = None,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Always fetch the report from the API"),
+    ] = False,
 ) -> None:
     """Generate an ad group performance report.
 
@@ -272,7 +354,10 @@ def ad_group_report(
     try:
         with client:
             with spinner("Generating ad group report..."):
-                report = client.reports.ad_groups(
+                report = cached_report(
+                    client,
+                    "ad_groups",
+                    refresh=no_cache,
                     campaign_id=campaign_id,
                     start_date=start_date,
                     end_date=end_date,
@@ -283,14 +368,13 @@ def ad_group_report(
                 print_warning("No data found for the specified period")
                 return
 
-            data = [report_row_to_dict(row) for row in report.row]
             columns = ["ad_group", "impressions", "taps", "installs", "ttr", "conv_rate", "spend"]
 
             if output:
-                save_report(data, output, columns)
+                save_report(report.row, output, columns)
             else:
                 print_report_table(
-                    data,
+                    (report_row_to_dict(row) for row in report.row),
                     columns,
                     f"Ad Group Report ({start} to {end})",
                 )
@@ -324,6 +408,10 @@ def keyword_report(
         Path | None,
         typer.Option("--output", "-o", help="Save to file (JSON or CSV)"),
     ] = None,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Always fetch the report from the API"),
+    ] = False,
 ) -> None:
     """Generate a keyword performance report.
 
@@ -340,7 +428,10 @@ def keyword_report(
     try:
         with client:
             with spinner("Generating keyword report..."):
-                report = client.reports.keywords(
+                report = cached_report(
+                    client,
+                    "keywords",
+                    refresh=no_cache,
                     campaign_id=campaign_id,
                     start_date=start_date,
                     end_date=end_date,
@@ -352,14 +443,13 @@ def keyword_report(
                 print_warning("No data found for the specified period")
                 return
 
-            data = [report_row_to_dict(row) for row in report.row]
             columns = ["keyword", "impressions", "taps", "installs", "ttr", "conv_rate", "spend", "avg_cpt"]
 
             if output:
-                save_report(data, output, columns)
+                save_report(report.row, output, columns)
             else:
                 print_report_table(
-                    data,
+                    (report_row_to_dict(row) for row in report.row),
                     columns,
                     f"Keyword Report ({start} to {end})",
                 )
@@ -393,6 +483,10 @@ def search_term_report(
         Path | None,
         typer.Option("--output", "-o", help="Save to file (JSON or CSV)"),
     ] = None,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Always fetch the report from the API"),
+    ] = False,
 ) -> None:
     """Generate a search term performance report.
 
@@ -410,7 +504,10 @@ def search_term_report(
     try:
         with client:
             with spinner("Generating search term report..."):
-                report = client.reports.search_terms(
+                report = cached_report(
+                    client,
+                    "search_terms",
+                    refresh=no_cache,
                     campaign_id=campaign_id,
                     start_date=start_date,
                     end_date=end_date,
@@ -422,14 +519,13 @@ def search_term_report(
                 print_warning("No data found for the specified period")
                 return
 
-            data = [report_row_to_dict(row) for row in report.row]
             columns = ["search_term", "impressions", "taps", "installs", "ttr", "conv_rate", "spend"]
 
             if output:
-                save_report(data, output, columns)
+                save_report(report.row, output, columns)
             else:
                 print_report_table(
-                    data,
+                    (report_row_to_dict(row) for row in report.row),
                     columns,
                     f"Search Term Report ({start} to {end})",
                 )
@@ -1,31 +1,48 @@
 """Shared utilities for CLI commands."""
 
+import csv
+import hashlib
+import importlib.util
+import io
 import json
-from collections.abc import Iterator
-from contextlib import contextmanager
+import os
+import re
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager, suppress
 from datetime import date
 from enum import Enum
+from functools import lru_cache, partial, wraps
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Any, TypeVar
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
 
+import httpx
 import typer
 from asa_api_client import AppleSearchAdsClient
 from asa_api_client.exceptions import AppleSearchAdsError, ConfigurationError
+from asa_api_client.models import ReportingResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-    TimeElapsedColumn,
-)
-from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 from rich.theme import Theme
 
+# Imported by name so the module is typed the same whether or not it is installed
+orjson: ModuleType | None
+try:
+    orjson = importlib.import_module("orjson")
+except ImportError:  # Optional speedup; the stdlib encoder is used without it
+    orjson = None
+
+if TYPE_CHECKING:
+    from rich.progress import Progress
+    from rich.syntax import Syntax
+
 # Custom theme for consistent styling
 ASA_THEME = Theme(
     {
@@ -45,6 +62,10 @@ console = Console(theme=ASA_THEME)
 error_console = Console(stderr=True, theme=ASA_THEME)
 
 T = TypeVar("T")
+P = ParamSpec("P")
+
+# A row of tabular output: a plain dict or an API model read by attribute
+Row = dict[str, Any] | BaseModel
 
 
 def enum_value(v: Enum | str | bool) -> str:
@@ -68,17 +89,75 @@ class OutputFormat(str, Enum):
     CSV = "csv"
 
 
+# Idle connections kept open for reuse; enough for the largest worker pool
+HTTP_KEEPALIVE_CONNECTIONS = 20
+
+# Seconds an idle connection is kept open for reuse
+HTTP_KEEPALIVE_EXPIRY = 30.0
+
+# HTTP/2 needs the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class _CLIClient(AppleSearchAdsClient):  # type: ignore[misc]
+    """API client whose connection pool is tuned for the CLI's concurrent workers.
+
+    Keeps idle connections open longer than httpx's five-second default and
+    multiplexes requests over HTTP/2 when h2 is installed, so concurrent
+    workers reuse connections instead of each opening their own TLS session.
+    The library creates its HTTP client lazily and offers no way to configure
+    it, so the factory is overridden; creation is locked because the first
+    request is often made from inside a worker pool.
+    """
+
+    _http_client: httpx.Client | None
+    _timeout: float
+    _http_client_lock = threading.Lock()
+
+    def _get_http_client(self) -> httpx.Client:
+        http_client = self._http_client
+        if http_client is None:
+            with self._http_client_lock:
+                http_client = self._http_client
+                if http_client is None:
+                    http_client = httpx.Client(
+                        timeout=self._timeout,
+                        follow_redirects=True,
+                        http2=HTTP2_AVAILABLE,
+                        limits=httpx.Limits(
+                            max_keepalive_connections=HTTP_KEEPALIVE_CONNECTIONS,
+                            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+                        ),
+                    )
+                    self._http_client = http_client
+        return http_client
+
+
+# Client shared by every command in this process; closing it (``with client:``)
+# only drops the HTTP connection, so it can be re-entered by the next command.
+_client: AppleSearchAdsClient | None = None
+
+
 def get_client() -> AppleSearchAdsClient:
     """Get an authenticated client from environment variables.
 
+    The client is created once per process and reused, so the access token
+    obtained by one command is not requested again by the next.
+
     Returns:
         An authenticated AppleSearchAdsClient.
 
     Raises:
         typer.Exit: If configuration is invalid.
     """
+    global _client
+
+    if _client is not None:
+        return _client
+
     try:
-        return AppleSearchAdsClient.from_env()
+        _client = _CLIClient.from_env()
+        return _client
     except ConfigurationError as e:
         print_error("Configuration Error", e.message)
         error_console.print()
@@ -126,6 +205,29 @@ def handle_api_error(e: AppleSearchAdsError) -> None:
     print_error("API Error", e.message, details=details)
 
 
+def api_command(fn: Callable[P, T]) -> Callable[P, T]:
+    """Report API errors raised by a command and exit with status 1.
+
+    Apply below ``@app.command()`` so Typer still sees the original signature.
+
+    Args:
+        fn: The command function to wrap.
+
+    Returns:
+        The wrapped command.
+    """
+
+    @wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        try:
+            return fn(*args, **kwargs)
+        except AppleSearchAdsError as e:
+            handle_api_error(e)
+            raise typer.Exit(1) from None
+
+    return wrapper
+
+
 # ============================================================================
 # Styled Output Functions
 # ============================================================================
@@ -207,21 +309,25 @@ def print_info_panel(title: str, content: str) -> None:
     console.print(panel)
 
 
-def print_result_panel(title: str, data: dict[str, Any]) -> None:
+def print_result_panel(title: str, data: dict[str, Any], style: str = "success") -> None:
     """Print a result in a styled panel with key-value pairs.
 
     Args:
         title: Panel title.
         data: Dictionary of key-value pairs to display.
+        style: Theme style for the title and border, e.g. "warning" for partial results.
     """
-    lines = []
+    grid = Table.grid(padding=(0, 1))
+    grid.add_column(style="label")
+    grid.add_column(style="value")
     for key, value in data.items():
-        lines.append(f"[label]{key}:[/label] [value]{value}[/value]")
+        # Text cells skip markup parsing, so values containing brackets render as-is
+        grid.add_row(Text(f"{key}:"), Text(str(value)))
 
     panel = Panel(
-        "\n".join(lines),
-        title=f"[success]{title}[/success]",
-        border_style="green",
+        grid,
+        title=f"[{style}]{title}[/{style}]",
+        border_style=style,
         padding=(0, 1),
     )
     console.print(panel)
@@ -232,8 +338,26 @@ def print_result_panel(title: str, data: dict[str, Any]) -> None:
 # ============================================================================
 
 
+@lru_cache(maxsize=64)
+def _model_cells(columns: tuple[str, ...]) -> Callable[[BaseModel], tuple[Any, ...]]:
+    """Build a getter returning the given columns of a model as a tuple.
+
+    Getters are cached per column set, since commands reuse the same columns.
+
+    Args:
+        columns: Attribute names to read.
+
+    Returns:
+        A callable mapping a model to its column values.
+    """
+    get = attrgetter(*columns)
+    if len(columns) == 1:
+        return lambda row: (get(row),)
+    return get
+
+
 def print_table(
-    data: list[dict[str, Any]],
+    data: Iterable[Row],
     columns: list[str],
     title: str | None = None,
     column_labels: dict[str, str] | None = None,
@@ -241,7 +365,8 @@ def print_table(
     """Print data as a rich table.
 
     Args:
-        data: List of dictionaries to display.
+        data: Dictionaries or models to display, consumed once. Models are
+            read by attribute, so no intermediate dicts are built.
         columns: Column names to include.
         title: Optional table title.
         column_labels: Optional mapping of column names to display labels.
@@ -259,8 +384,12 @@ def print_table(
         label = labels.get(col, col.replace("_", " ").title())
         table.add_column(label)
 
+    model_cells = _model_cells(tuple(columns))
     for row in data:
-        table.add_row(*[str(row.get(col, "")) for col in columns])
+        if isinstance(row, BaseModel):
+            table.add_row(*map(str, model_cells(row)))
+        else:
+            table.add_row(*[str(row.get(col, "")) for col in columns])
 
     console.print(table)
 
@@ -270,27 +399,86 @@ def print_table(
 # ============================================================================
 
 
+# Options for serializing API models as JSON output
+_DUMP_KWARGS: dict[str, Any] = {"by_alias": True, "exclude_none": True, "indent": 2}
+
+
+@lru_cache(maxsize=32)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Get a cached adapter for serializing lists of a model type."""
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+# Columns taken by a Panel's borders and padding
+PANEL_CHROME_WIDTH = 4
+
+
+@lru_cache(maxsize=1)
+def _json_syntax() -> Callable[..., "Syntax"]:
+    """Build the JSON highlighter once per process.
+
+    Returns:
+        A callable wrapping a JSON string in a preconfigured Syntax; it
+        also takes Syntax's keyword options, such as ``word_wrap``.
+    """
+    # Imported here since it pulls in Pygments, which most commands never need
+    from rich.syntax import Syntax
+
+    return partial(
+        Syntax,
+        lexer="json",
+        theme=Syntax.get_theme("monokai"),
+        line_numbers=False,
+    )
+
+
+def _write_output(payload: bytes) -> None:
+    """Write encoded output straight to the console's underlying byte stream.
+
+    Args:
+        payload: UTF-8 encoded bytes to write.
+    """
+    out = console.file
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        # An in-memory text stream (e.g. captured output) has no byte layer
+        out.write(payload.decode())
+    else:
+        out.flush()
+        buffer.write(payload)
+        buffer.flush()
+
+
 def print_json(data: Any, title: str | None = None) -> None:
     """Print data as syntax-highlighted JSON.
 
+    When output is not a terminal the JSON is written as-is, without
+    highlighting or a title panel.
+
     Args:
         data: Data to print as JSON.
         title: Optional title to display above the JSON.
     """
-    if hasattr(data, "model_dump"):
-        data = data.model_dump(by_alias=True, exclude_none=True)
-    elif isinstance(data, list) and data and hasattr(data[0], "model_dump"):
-        data = [item.model_dump(by_alias=True, exclude_none=True) for item in data]
+    # Pydantic models are serialized by pydantic-core directly, without an intermediate dict
+    if isinstance(data, BaseModel):
+        json_bytes = data.model_dump_json(**_DUMP_KWARGS).encode()
+    elif isinstance(data, list) and data and isinstance(data[0], BaseModel):
+        adapter = _list_adapter(type(data[0]))
+        json_bytes = adapter.dump_json(data, **_DUMP_KWARGS)
+    else:
+        json_bytes = dump_json(data, indent=True)
 
-    json_str = json.dumps(data, indent=2, default=str)
+    # Highlighting is invisible when piped, so skip Rich and write plain JSON
+    if not console.is_terminal:
+        _write_output(json_bytes + b"\n")
+        return
 
-    syntax = Syntax(
-        json_str,
-        "json",
-        theme="monokai",
-        line_numbers=False,
-        word_wrap=True,
-    )
+    json_str = json_bytes.decode()
+
+    # The JSON is already indented, so wrapping is only needed when a line is too wide
+    width = console.width - (PANEL_CHROME_WIDTH if title else 0)
+    longest = max(map(len, json_str.splitlines()), default=0)
+    syntax = _json_syntax()(json_str, word_wrap=longest > width)
 
     if title:
         panel = Panel(syntax, title=f"[info]{title}[/info]", border_style="cyan")
@@ -299,23 +487,85 @@ def print_json(data: Any, title: str | None = None) -> None:
         console.print(syntax)
 
 
-def print_csv(data: list[dict[str, Any]], columns: list[str]) -> None:
+def print_json_stream(data: Iterable[Any], title: str | None = None) -> None:
+    """Print rows as a JSON array, streaming them when output is not a terminal.
+
+    Piped output is written one record at a time without highlighting or a
+    title panel, so large listings never exist as one string and the output
+    is plain JSON. Terminal output is highlighted via `print_json`.
+
+    Args:
+        data: Rows (dicts or Pydantic models) to print, consumed once.
+        title: Optional title, shown only on a terminal.
+    """
+    if console.is_terminal:
+        print_json(list(data), title)
+        return
+
+    out = console.file
+    separator = "[\n"
+    for item in data:
+        if isinstance(item, BaseModel):
+            chunk = item.model_dump_json(**_DUMP_KWARGS)
+        else:
+            chunk = dump_json(item, indent=True).decode()
+        out.write(separator + "  " + chunk.replace("\n", "\n  "))
+        separator = ",\n"
+    out.write("[]\n" if separator == "[\n" else "\n]\n")
+    out.flush()
+
+
+# Bytes of CSV output collected before each write to stdout
+CSV_BUFFER_SIZE = 64 * 1024
+
+
+def print_csv(data: Iterable[Row], columns: list[str]) -> None:
     """Print data as CSV.
 
     Args:
-        data: List of dictionaries to print.
+        data: Dictionaries or models to print, consumed once. Missing dict
+            columns are written as empty cells; models are read by attribute.
         columns: Column names to include.
     """
-    import csv
-    import sys
-
-    writer = csv.DictWriter(sys.stdout, fieldnames=columns, extrasaction="ignore")
-    writer.writeheader()
-    writer.writerows(data)
+    # One C-level lookup per row for the common case where every column is present
+    get = itemgetter(*columns) if len(columns) > 1 else lambda row: (row[columns[0]],)
+    model_cells = _model_cells(tuple(columns))
+
+    def cells(row: Row) -> Any:
+        if isinstance(row, BaseModel):
+            return model_cells(row)
+        try:
+            return get(row)
+        except KeyError:
+            return [row.get(col, "") for col in columns]
+
+    stdout_buffer = getattr(sys.stdout, "buffer", None)
+    if stdout_buffer is None:
+        # Already an in-memory text stream (e.g. captured output); nothing to batch
+        writer = csv.writer(sys.stdout)
+        writer.writerow(columns)
+        writer.writerows(map(cells, data))
+        return
+
+    # Batch rows into large writes instead of many small ones to a possibly line-buffered stdout
+    sys.stdout.flush()
+    out = io.TextIOWrapper(
+        io.BufferedWriter(stdout_buffer, buffer_size=CSV_BUFFER_SIZE),
+        encoding=sys.stdout.encoding,
+        newline="",
+    )
+    try:
+        writer = csv.writer(out)
+        writer.writerow(columns)
+        writer.writerows(map(cells, data))
+    finally:
+        out.flush()
+        # Detach both wrappers so collecting them doesn't close stdout
+        out.detach().detach()
 
 
 def output_data(
-    data: list[dict[str, Any]],
+    data: Iterable[Row],
     columns: list[str],
     format: OutputFormat,
     title: str | None = None,
@@ -323,15 +573,19 @@ def output_data(
 ) -> None:
     """Output data in the specified format.
 
+    Rows are streamed from ``data``, so callers can pass a generator; only
+    highlighted JSON on a terminal needs the full list to render. Pydantic
+    models can be passed as-is instead of being dumped to dicts first.
+
     Args:
-        data: Data to output.
+        data: Rows (dicts or models) to output.
         columns: Column names for table/CSV output.
         format: Output format.
         title: Optional title for table output.
         column_labels: Optional mapping of column names to display labels.
     """
     if format == OutputFormat.JSON:
-        print_json(data, title)
+        print_json_stream(data, title)
     elif format == OutputFormat.CSV:
         print_csv(data, columns)
     else:
@@ -361,7 +615,14 @@ def spinner(message: str) -> Iterator[None]:
         yield
 
 
-def create_progress() -> Progress:
+# Redraw rate for progress bars; the bar only needs to look live
+PROGRESS_REFRESH_PER_SECOND = 4
+
+# Items consumed between progress updates in iterate_with_progress
+PROGRESS_BATCH_SIZE = 256
+
+
+def create_progress() -> "Progress":
     """Create a progress bar for iteration.
 
     Returns:
@@ -373,6 +634,15 @@ def create_progress() -> Progress:
             for item in items:
                 progress.advance(task)
     """
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -380,6 +650,7 @@ def create_progress() -> Progress:
         TaskProgressColumn(),
         TimeElapsedColumn(),
         console=console,
+        refresh_per_second=PROGRESS_REFRESH_PER_SECOND,
     )
 
 
@@ -390,6 +661,9 @@ def iterate_with_progress(
 ) -> Iterator[T]:
     """Iterate over items with a progress bar.
 
+    The bar is advanced in batches of ``PROGRESS_BATCH_SIZE`` items, so
+    fast iterators are not slowed down by progress bookkeeping.
+
     Args:
         items: Iterator to wrap.
         total: Total number of items (if known).
@@ -404,9 +678,14 @@ def iterate_with_progress(
     """
     with create_progress() as progress:
         task = progress.add_task(description, total=total)
+        pending = 0
         for item in items:
             yield item
-            progress.advance(task)
+            pending += 1
+            if pending == PROGRESS_BATCH_SIZE:
+                progress.advance(task, pending)
+                pending = 0
+        progress.advance(task, pending)
 
 
 # ============================================================================
@@ -414,9 +693,12 @@ def iterate_with_progress(
 # ============================================================================
 
 
+@lru_cache(maxsize=256)
 def parse_date(value: str) -> date:
     """Parse a date string in YYYY-MM-DD format.
 
+    Results are cached, so repeated arguments are parsed once.
+
     Args:
         value: Date string to parse.
 
@@ -435,14 +717,20 @@ def parse_date(value: str) -> date:
 def save_to_file(content: str, path: Path) -> None:
     """Save content to a file.
 
+    The content is encoded as UTF-8 once and written in a single call.
+
     Args:
         content: Content to save.
         path: File path.
     """
-    path.write_text(content)
+    path.write_bytes(content.encode("utf-8"))
     print_success(f"Saved to {path}")
 
 
+# Placeholder shown for missing values in formatted output
+MISSING_VALUE = "-"
+
+
 def format_number(value: int | float | None) -> str:
     """Format a number with thousands separators.
 
@@ -453,8 +741,9 @@ def format_number(value: int | float | None) -> str:
         Formatted string or "-" if None.
     """
     if value is None:
-        return "-"
-    if isinstance(value, float):
+        return MISSING_VALUE
+    # Exact type check: these run once per table cell
+    if type(value) is float:
         return f"{value:,.2f}"
     return f"{value:,}"
 
@@ -470,7 +759,7 @@ def format_money(amount: str | None, currency: str | None = None) -> str:
         Formatted money string.
     """
     if amount is None:
-        return "-"
+        return MISSING_VALUE
     if currency:
         return f"{amount} {currency}"
     return amount
@@ -486,13 +775,19 @@ def format_percent(value: float | None) -> str:
         Formatted percentage string.
     """
     if value is None:
-        return "-"
+        return MISSING_VALUE
     return f"{value:.2%}"
 
 
+# Answer every confirmation prompt with yes, for scripts and CI where nobody can type
+ASSUME_YES = os.environ.get("ASA_CLI_ASSUME_YES", "").lower() in ("1", "true", "yes")
+
+
 def confirm_action(message: str, default: bool = False) -> bool:
     """Ask for confirmation with styled prompt.
 
+    Returns True without prompting when ``ASA_CLI_ASSUME_YES`` is set.
+
     Args:
         message: Confirmation message.
         default: Default value if user just presses Enter.
@@ -500,4 +795,259 @@ def confirm_action(message: str, default: bool = False) -> bool:
     Returns:
         True if confirmed, False otherwise.
     """
+    if ASSUME_YES:
+        return True
     return typer.confirm(message, default=default)
+
+
+# ============================================================================
+# JSON Encoding
+# ============================================================================
+
+
+# Small floats orjson writes differently from Python's repr ("0.00001" for 1e-05, "5e-7" for 5e-07)
+_ORJSON_SMALL_FLOAT_HINT = re.compile(rb"\d\.0000\d|\de-\d")
+
+# A JSON string (left as-is) or a float literal, for rewriting floats in Python's form
+_JSON_STRING_OR_FLOAT = re.compile(rb'"(?:[^"\\]|\\.)*"|-?\d+\.\d+(?:e[-+]?\d+)?|-?\d+e[-+]?\d+')
+
+# Characters the stdlib encoder escapes by default
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def _repr_float(match: re.Match[bytes]) -> bytes:
+    """Rewrite a float literal the way the stdlib encoder writes it, leaving strings alone."""
+    token = match.group()
+    return token if token.startswith(b'"') else repr(float(token)).encode()
+
+
+def _escape_non_ascii(match: re.Match[str]) -> str:
+    """Escape a character as ``\\uXXXX`` (a surrogate pair beyond the BMP), as the stdlib encoder does."""
+    return json.dumps(match.group())[1:-1]
+
+
+def dump_json(value: Any, indent: bool = False) -> bytes:
+    """Serialize a value to UTF-8 JSON, using orjson when it is installed.
+
+    Values JSON can't represent natively (dates, Decimals...) are written as
+    their string form. Indented output is the same whether or not orjson is
+    installed: it is adjusted to escape non-ASCII characters and write floats
+    the way ``json.dumps`` does.
+
+    Args:
+        value: Value to serialize.
+        indent: Indent nested values by two spaces.
+
+    Returns:
+        The encoded JSON.
+    """
+    if orjson is None:
+        return json.dumps(value, default=str, indent=2 if indent else None).encode()
+
+    # Non-string keys are converted like the stdlib encoder does, and datetimes and
+    # dataclasses go through str() rather than orjson's own formats
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    encoded: bytes = orjson.dumps(value, default=str, option=option)
+    # Both fix-ups are rarely needed, so they are only run when a cheap scan finds work
+    if _ORJSON_SMALL_FLOAT_HINT.search(encoded):
+        encoded = _JSON_STRING_OR_FLOAT.sub(_repr_float, encoded)
+    if not encoded.isascii():
+        encoded = _NON_ASCII.sub(_escape_non_ascii, encoded.decode()).encode()
+    return encoded
+
+
+def load_json(data: bytes) -> Any:
+    """Parse UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        data: The encoded JSON.
+
+    Returns:
+        The decoded value.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# ============================================================================
+# Disk Cache
+# ============================================================================
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "asa-cli"
+
+
+def cache_key(*parts: Any) -> str:
+    """Build a stable cache key from arbitrary JSON-serializable parts.
+
+    Args:
+        parts: Values identifying the cached request (account, endpoint, IDs...).
+
+    Returns:
+        A hex digest suitable for use as a file name.
+    """
+    raw = json.dumps(parts, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def cache_read(namespace: str, key: str, ttl: float) -> bytes | None:
+    """Read a cached entry's raw JSON if it exists and is younger than the TTL.
+
+    Args:
+        namespace: Cache sub-directory (e.g. "keywords").
+        key: Key from `cache_key`.
+        ttl: Maximum age in seconds.
+
+    Returns:
+        The cached bytes, or None on a miss.
+    """
+    path = CACHE_DIR / namespace / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def cache_write(namespace: str, key: str, data: bytes) -> None:
+    """Write raw JSON to the cache.
+
+    Failures are ignored since the cache is only an optimization.
+
+    Args:
+        namespace: Cache sub-directory (e.g. "keywords").
+        key: Key from `cache_key`.
+        data: Encoded JSON to store.
+    """
+    path = CACHE_DIR / namespace / f"{key}.json"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    except OSError:
+        pass
+
+
+def cache_delete(namespace: str, key: str) -> None:
+    """Remove a cached entry if it exists.
+
+    Args:
+        namespace: Cache sub-directory (e.g. "keywords").
+        key: Key from `cache_key`.
+    """
+    with suppress(OSError):
+        (CACHE_DIR / namespace / f"{key}.json").unlink()
+
+
+def cache_prune(namespace: str, max_age: float) -> None:
+    """Remove cached entries older than ``max_age``.
+
+    Failures are ignored since the cache is only an optimization.
+
+    Args:
+        namespace: Cache sub-directory (e.g. "keywords").
+        max_age: Age in seconds past which entries are removed.
+    """
+    cutoff = time.time() - max_age
+    with suppress(OSError):
+        for path in (CACHE_DIR / namespace).glob("*.json"):
+            with suppress(OSError):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+
+
+def cache_get(namespace: str, key: str, ttl: float) -> Any | None:
+    """Read a cached value if it exists and is younger than the TTL.
+
+    Args:
+        namespace: Cache sub-directory (e.g. "keywords").
+        key: Key from `cache_key`.
+        ttl: Maximum age in seconds.
+
+    Returns:
+        The cached value, or None on a miss.
+    """
+    data = cache_read(namespace, key, ttl)
+    if data is None:
+        return None
+    try:
+        return load_json(data)
+    except ValueError:
+        return None
+
+
+def cache_set(namespace: str, key: str, value: Any) -> None:
+    """Write a JSON-serializable value to the cache.
+
+    Args:
+        namespace: Cache sub-directory (e.g. "keywords").
+        key: Key from `cache_key`.
+        value: Value to store.
+    """
+    cache_write(namespace, key, dump_json(value))
+
+
+# How long cached reports for closed date ranges stay valid, in seconds.
+# Kept short because Apple keeps restating installs and conversions for days.
+REPORT_CACHE_TTL = 3600
+
+
+def _report_cache_key(client: AppleSearchAdsClient, endpoint: str, params: dict[str, Any]) -> str:
+    """Build the cache key for a report request."""
+    return cache_key(client.org_id, endpoint, sorted(params.items()))
+
+
+def cached_report(
+    client: AppleSearchAdsClient,
+    endpoint: str,
+    refresh: bool = False,
+    **params: Any,
+) -> ReportingResponse:
+    """Fetch a report, reusing an on-disk copy if available.
+
+    Only ranges that ended before today are cached, and only for
+    REPORT_CACHE_TTL; ranges including today are always fetched.
+
+    Args:
+        client: The API client.
+        endpoint: Name of the report method on ``client.reports``
+            (e.g. "campaigns", "keywords").
+        refresh: Skip the cache read and fetch a fresh report.
+        **params: Arguments for the report method; must include ``end_date``.
+
+    Returns:
+        The report.
+    """
+    # Today's numbers are still coming in, so they are never cached
+    if params["end_date"] >= date.today():
+        report: ReportingResponse = getattr(client.reports, endpoint)(**params)
+        return report
+
+    key = _report_cache_key(client, endpoint, params)
+    if not refresh:
+        cached = cache_read("reports", key, ttl=REPORT_CACHE_TTL)
+        if cached is not None:
+            # Parsed straight into the model by pydantic-core, without an intermediate dict
+            with suppress(ValidationError):
+                return ReportingResponse.model_validate_json(cached)
+
+    report = getattr(client.reports, endpoint)(**params)
+    cache_write("reports", key, report.model_dump_json(by_alias=True).encode())
+    # Keys include the date range, so old windows would otherwise pile up
+    cache_prune("reports", REPORT_CACHE_TTL)
+    return report
+
+
+def forget_report(client: AppleSearchAdsClient, endpoint: str, **params: Any) -> None:
+    """Drop a cached report so the next `cached_report` call fetches it again.
+
+    Call this after changing something the report shows, such as a bid.
+
+    Args:
+        client: The API client.
+        endpoint: Name of the report method on ``client.reports``.
+        **params: The same arguments passed to `cached_report`.
+    """
+    cache_delete("reports", _report_cache_key(client, endpoint, params))
@@ -3,6 +3,7 @@
 from typer.testing import CliRunner
 
 from asa_api_cli import app
+from asa_api_cli.main import SUBCOMMANDS
 
 runner = CliRunner()
 
@@ -37,3 +38,25 @@ def test_auth_help() -> None:
     assert result.exit_code == 0
     assert "show" in result.stdout
     assert "test" in result.stdout
+
+
+def test_help_lists_lazy_subcommands() -> None:
+    """Test --help lists every lazily loaded subcommand."""
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    for name in SUBCOMMANDS:
+        assert name in result.stdout
+
+
+def test_lazy_subcommand_help_has_no_completion_options() -> None:
+    """Test a lazily loaded subcommand's help omits the completion options."""
+    result = runner.invoke(app, ["optimize", "--help"])
+    assert result.exit_code == 0
+    assert "bid-check" in result.stdout
+    assert "--install-completion" not in result.stdout
+
+
+def test_unknown_subcommand() -> None:
+    """Test an unknown subcommand is rejected."""
+    result = runner.invoke(app, ["nope"])
+    assert result.exit_code != 0
@@ -0,0 +1,294 @@
+"""Tests for optimization command helpers."""
+
+import csv
+import re
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+import typer
+from asa_api_client.exceptions import AppleSearchAdsError, RateLimitError
+from asa_api_client.models import ReportingResponse
+from typer.testing import CliRunner
+
+from asa_api_cli import optimize
+from asa_api_cli.optimize import (
+    AdGroupPlan,
+    CampaignPlan,
+    KeywordPlan,
+    RateLimiter,
+    _plan_problems,
+    _select_campaigns_interactive,
+    app,
+    call_with_backoff,
+)
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record sleeps in the optimize module instead of waiting."""
+    recorded: list[float] = []
+    monkeypatch.setattr(optimize.time, "sleep", recorded.append)
+    return recorded
+
+
+def test_rate_limiter_spaces_calls(sleeps: list[float]) -> None:
+    """Test consecutive calls are spaced by the limiter's interval."""
+    limiter = RateLimiter(rate=10.0)
+    limiter.wait()
+    limiter.wait()
+    assert sleeps[0] == 0.0
+    assert sleeps[1] == pytest.approx(0.1, abs=0.01)
+
+
+def test_rate_limiter_pause_holds_back_workers(sleeps: list[float]) -> None:
+    """Test a pause delays the next call for every worker."""
+    limiter = RateLimiter(rate=1000.0)
+    limiter.pause(5.0)
+    limiter.wait()
+    assert sleeps[0] == pytest.approx(5.0, abs=0.05)
+
+
+@pytest.mark.usefixtures("sleeps")
+def test_call_with_backoff_returns_result() -> None:
+    """Test a successful call passes its result through."""
+    assert call_with_backoff(lambda: 42, RateLimiter(rate=1000.0)) == 42
+
+
+def test_call_with_backoff_does_not_retry_rate_limits(sleeps: list[float]) -> None:
+    """Test a rate limit is raised after one attempt and pauses the limiter."""
+    calls = 0
+
+    def rate_limited() -> None:
+        nonlocal calls
+        calls += 1
+        raise RateLimitError("Too many requests", retry_after=7)
+
+    limiter = RateLimiter(rate=1000.0)
+    with pytest.raises(RateLimitError):
+        call_with_backoff(rate_limited, limiter)
+    assert calls == 1
+
+    limiter.wait()
+    assert sleeps[-1] == pytest.approx(7.0, abs=0.05)
+
+
+def _plan(**overrides: Any) -> CampaignPlan:
+    """Build a valid one-keyword campaign plan, with optional field overrides."""
+    keyword = KeywordPlan(text="chippy", bid=Decimal("1.50"), currency="USD", source_count=1)
+    values: dict[str, Any] = {
+        "name": "Chippy - CA - Generic - Exact Match",
+        "country": "CA",
+        "adam_id": 1,
+        "daily_budget": Decimal("50"),
+        "currency": "USD",
+        "ad_groups": [AdGroupPlan(name="chippy", keyword=keyword)],
+    }
+    values.update(overrides)
+    return CampaignPlan(**values)
+
+
+def test_plan_problems_valid_plan() -> None:
+    """Test a valid plan has no problems."""
+    assert _plan_problems(_plan()) == []
+
+
+def test_plan_problems_reports_each_problem() -> None:
+    """Test invalid plan values are each reported."""
+    long_keyword = KeywordPlan(text="k" * 81, bid=Decimal("0"), currency="USD", source_count=1)
+    plan = _plan(
+        name="",
+        country="CAN",
+        daily_budget=Decimal("0"),
+        ad_groups=[AdGroupPlan(name="long", keyword=long_keyword)],
+    )
+    assert len(_plan_problems(plan)) == 5
+    assert _plan_problems(_plan(ad_groups=[])) == ["The plan has no keywords to create ad groups for"]
+
+
+def _select(monkeypatch: pytest.MonkeyPatch, selection: str, count: int = 5) -> list[int]:
+    """Run interactive campaign selection with a typed answer, returning the selected IDs."""
+    campaigns = [
+        SimpleNamespace(id=i, name=f"Chippy - C{i} - Generic - EM", status="ENABLED") for i in range(1, count + 1)
+    ]
+    monkeypatch.setattr(typer, "prompt", lambda *_args, **_kwargs: selection)
+    return [c.id for c in _select_campaigns_interactive(campaigns)]
+
+
+def test_selection_numbers_and_ranges(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test numbers and ranges select the listed rows in order."""
+    assert _select(monkeypatch, "4, 1-2") == [1, 2, 4]
+    assert _select(monkeypatch, "all") == [1, 2, 3, 4, 5]
+
+
+def test_selection_clamps_ranges(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test ranges beyond the listed rows are clamped."""
+    assert _select(monkeypatch, "0-99999999") == [1, 2, 3, 4, 5]
+    assert _select(monkeypatch, "7") == []
+
+
+def test_selection_ignores_unrecognized_parts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test malformed parts of a selection are skipped."""
+    assert _select(monkeypatch, "2,abc,3") == [2, 3]
+
+
+def _keyword_report(*impressions: int, status: str = "ACTIVE") -> ReportingResponse:
+    """Build a keyword report with one row per impression count."""
+    rows = [
+        {
+            "metadata": {
+                "adGroupId": 10,
+                "adGroupName": "chippy",
+                "keywordId": i,
+                "keyword": f"keyword {i}",
+                "keywordStatus": status,
+                "bidAmount": {"amount": "1.00", "currency": "USD"},
+            },
+            "total": {
+                "impressions": count,
+                "taps": count // 10,
+                "localSpend": {"amount": "5.00", "currency": "USD"},
+            },
+        }
+        for i, count in enumerate(impressions, 1)
+    ]
+    return ReportingResponse.model_validate({"row": rows})
+
+
+@pytest.fixture
+def bid_review_reports(monkeypatch: pytest.MonkeyPatch) -> dict[int, ReportingResponse]:
+    """Serve bid-review's campaigns and keyword reports from memory, keyed by campaign ID."""
+    reports: dict[int, ReportingResponse] = {}
+    campaigns = [SimpleNamespace(id=1, name="Chippy - US - Generic - EM", countries_or_regions=["US"])]
+    monkeypatch.setattr(optimize, "get_client", MagicMock)
+    monkeypatch.setattr(optimize, "_cached_campaigns", lambda *_args, **_kwargs: campaigns)
+    monkeypatch.setattr(
+        optimize, "_cached_keyword_report", lambda _client, campaign_id, **_kwargs: reports[campaign_id]
+    )
+    return reports
+
+
+def test_bid_review_shows_most_viewed_keywords(bid_review_reports: dict[int, ReportingResponse]) -> None:
+    """Test bid-review displays the top keywords by impressions and counts the rest."""
+    bid_review_reports[1] = _keyword_report(50, 5000, 500)
+    result = runner.invoke(app, ["bid-review", "--limit", "2"])
+    assert result.exit_code == 0
+    assert result.stdout.index("keyword 2") < result.stdout.index("keyword 3")
+    assert "keyword 1" not in result.stdout
+    assert "Showing 2 of 3 keywords" in result.stdout
+
+
+def test_bid_review_limit_zero_still_exports(bid_review_reports: dict[int, ReportingResponse], tmp_path: Path) -> None:
+    """Test --limit 0 skips the table but still exports and summarises every keyword."""
+    bid_review_reports[1] = _keyword_report(50, 5000, 500)
+    output = tmp_path / "keywords.csv"
+    result = runner.invoke(app, ["bid-review", "--limit", "0", "--output", str(output)])
+    assert result.exit_code == 0
+    assert "Exported 3 keywords" in result.stdout
+    assert "keyword 1" not in result.stdout
+    with output.open(newline="") as f:
+        assert [row["keyword"] for row in csv.DictReader(f)] == ["keyword 1", "keyword 2", "keyword 3"]
+
+
+def test_bid_review_distinguishes_no_data_from_no_matches(bid_review_reports: dict[int, ReportingResponse]) -> None:
+    """Test filtered-out keywords report no matches, while inactive keywords report no data."""
+    bid_review_reports[1] = _keyword_report(50, 5000)
+    result = runner.invoke(app, ["bid-review", "--min-impressions", "10000"])
+    assert "No keywords match the specified filters" in result.stdout
+
+    bid_review_reports[1] = _keyword_report(50, 5000, status="PAUSED")
+    result = runner.invoke(app, ["bid-review"])
+    assert "No keyword data found" in result.stdout
+
+
+def test_bid_check_reads_cacheable_keyword_reports(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test bid-check's keyword report window ends before today so the report cache applies."""
+    requests: list[dict[str, Any]] = []
+
+    def keyword_report(_client: Any, _campaign_id: int, _start_date: date, end_date: date, refresh: bool) -> Any:
+        requests.append({"end_date": end_date, "refresh": refresh})
+        return _keyword_report(500)
+
+    campaign = SimpleNamespace(id=1, name="Chippy - US - Generic - EM", countries_or_regions=["US"])
+    monkeypatch.setattr(optimize, "get_client", MagicMock)
+    monkeypatch.setattr(optimize, "_iter_campaigns", lambda *_args, **_kwargs: iter([campaign]))
+    monkeypatch.setattr(optimize, "_cached_keyword_report", keyword_report)
+
+    result = runner.invoke(app, ["bid-check", "--no-cache"])
+    assert result.exit_code == 0
+    (request,) = requests
+    assert request["end_date"] < date.today()
+    assert request["refresh"]
+
+
+def _expand_client(failing_ad_group: str, failing_keyword: str) -> MagicMock:
+    """Build a fake client for expand where one ad group and one keyword fail to create."""
+    client = MagicMock()
+    client.campaigns.find.return_value = [
+        SimpleNamespace(
+            id=1,
+            name="Chippy - US - Generic - EM",
+            countries_or_regions=["US"],
+            adam_id=99,
+            daily_budget_amount=SimpleNamespace(amount="50", currency="USD"),
+        )
+    ]
+    client.campaigns.create.return_value = SimpleNamespace(id=2, name="Chippy - CA - Generic - EM")
+
+    campaign_res = client.campaigns.return_value
+    ad_group_ids = iter(range(100, 200))
+
+    def create_ad_group(payload: Any) -> SimpleNamespace:
+        if payload.name == failing_ad_group:
+            raise AppleSearchAdsError("ad group rejected")
+        return SimpleNamespace(id=next(ad_group_ids), name=payload.name)
+
+    def create_keywords(payloads: list[Any]) -> None:
+        if payloads[0].text == failing_keyword:
+            raise AppleSearchAdsError("keyword rejected")
+
+    campaign_res.ad_groups.create.side_effect = create_ad_group
+    ad_group_res = campaign_res.ad_groups.return_value
+    ad_group_res.keywords.create_bulk.side_effect = create_keywords
+    ad_group_res.negative_keywords.create_bulk.side_effect = lambda batch: SimpleNamespace(data=batch)
+    return client
+
+
+def test_expand_reports_partial_ad_group_creation(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test expand counts failed ad groups and keywords separately and names orphaned ad groups."""
+    client = _expand_client(failing_ad_group="Exact - Keyword 3", failing_keyword="keyword 2")
+    monkeypatch.setattr(optimize, "get_client", lambda: client)
+    monkeypatch.setattr(optimize, "_cached_keyword_report", lambda *_args, **_kwargs: _keyword_report(500, 400, 300))
+    monkeypatch.setattr(optimize, "confirm_action", lambda *_args, **_kwargs: True)
+
+    result = runner.invoke(app, ["expand", "1", "--country", "CA"])
+    assert result.exit_code == 0
+    output = " ".join(result.stdout.split())
+    assert "Could not create ad group Exact - Keyword 3: ad group rejected" in output
+    assert re.search(r"Created ad group Exact - Keyword 2 \(ID: \d+\) but its keyword could not be added", output)
+    assert "Campaign Created with Errors" in output
+    assert "Ad Groups: 2" in output
+    assert "Keywords: 1" in output
+    # Only the ad group with its keyword gets the other keywords as negatives
+    assert "Negative Keywords: 2" in output
+
+
+def test_expand_reports_success(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a fully created campaign is reported as a success."""
+    client = _expand_client(failing_ad_group="", failing_keyword="")
+    monkeypatch.setattr(optimize, "get_client", lambda: client)
+    monkeypatch.setattr(optimize, "_cached_keyword_report", lambda *_args, **_kwargs: _keyword_report(500, 400))
+    monkeypatch.setattr(optimize, "confirm_action", lambda *_args, **_kwargs: True)
+
+    result = runner.invoke(app, ["expand", "1", "--country", "CA"])
+    assert result.exit_code == 0
+    output = " ".join(result.stdout.split())
+    assert "Campaign Created Successfully" in output
+    assert "Keywords: 2" in output
+    assert "Negative Keywords: 2" in output
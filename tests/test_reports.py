@@ -0,0 +1,66 @@
+"""Tests for report export."""
+
+import csv
+import io
+import json
+from pathlib import Path
+
+import pytest
+from asa_api_client.models import ReportingResponse
+
+from asa_api_cli.reports import report_row_to_dict, save_report
+
+KEYWORD_COLUMNS = ["keyword", "impressions", "taps", "installs", "ttr", "conv_rate", "spend", "avg_cpt"]
+
+# Report rows covering missing metrics, missing money fields and non-ASCII text
+REPORT = ReportingResponse.model_validate(
+    {
+        "row": [
+            {
+                "metadata": {"keyword": "café, crème", "countryOrRegion": "FR"},
+                "total": {
+                    "impressions": 1200,
+                    "taps": 60,
+                    "installs": 9,
+                    "ttr": 0.05,
+                    "conversionRate": 0.15,
+                    "localSpend": {"amount": "42.50", "currency": "EUR"},
+                    "avgCPT": {"amount": "0.71", "currency": "EUR"},
+                },
+            },
+            {
+                "metadata": {"keyword": "tiny", "campaignName": ""},
+                "total": {"impressions": 3, "taps": 0, "installs": 0, "ttr": 0.0},
+            },
+            {"metadata": {"keyword": "no metrics"}},
+        ]
+    }
+)
+
+
+def test_save_report_json_matches_list_dump(tmp_path: Path) -> None:
+    """Test streamed JSON is the same as dumping the whole list of row dicts."""
+    output = tmp_path / "report.json"
+    save_report(iter(REPORT.row), output, KEYWORD_COLUMNS)
+    expected = json.dumps([report_row_to_dict(row) for row in REPORT.row], indent=2, default=str)
+    assert output.read_text() == expected
+
+
+def test_save_report_json_empty(tmp_path: Path) -> None:
+    """Test a report without rows is saved as an empty JSON array."""
+    output = tmp_path / "report.json"
+    save_report(iter([]), output, KEYWORD_COLUMNS)
+    assert json.loads(output.read_text()) == []
+
+
+@pytest.mark.parametrize("columns", [KEYWORD_COLUMNS, ["keyword"]])
+def test_save_report_csv_matches_dict_writer(tmp_path: Path, columns: list[str]) -> None:
+    """Test CSV cells read from the row view match writing the row dicts with DictWriter."""
+    output = tmp_path / "report.csv"
+    save_report(iter(REPORT.row), output, columns)
+
+    expected = io.StringIO(newline="")
+    writer = csv.DictWriter(expected, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(report_row_to_dict(row) for row in REPORT.row)
+    assert output.read_bytes().decode() == expected.getvalue()
@@ -0,0 +1,169 @@
+"""Tests for shared CLI utilities."""
+
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from asa_api_client.models import ReportingResponse
+
+from asa_api_cli import utils
+from asa_api_cli.utils import cached_report, dump_json, print_csv
+
+YESTERDAY = date.today() - timedelta(days=1)
+
+
+# A keyword report row as the API returns it, with daily granularity
+KEYWORD_ROW: dict[str, Any] = {
+    "metadata": {
+        "adGroupId": 10,
+        "keywordId": 20,
+        "keyword": "chippy",
+        "keywordStatus": "ACTIVE",
+        "bidAmount": {"amount": "1.50", "currency": "USD"},
+    },
+    "total": {"impressions": 120, "taps": 6, "localSpend": {"amount": "4.20", "currency": "USD"}},
+    "granularity": [
+        {"impressions": 70, "taps": 4},
+        {"impressions": 50, "taps": 2},
+    ],
+}
+
+
+class FakeReports:
+    """Stand-in for ``client.reports`` that counts keyword report requests."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def keywords(self, **_params: Any) -> ReportingResponse:
+        """Return a one-row keyword report."""
+        self.calls += 1
+        return ReportingResponse.model_validate({"row": [KEYWORD_ROW]})
+
+
+@pytest.fixture
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Any:
+    """A fake API client with the disk cache redirected to a temporary directory."""
+    monkeypatch.setattr(utils, "CACHE_DIR", tmp_path)
+    return SimpleNamespace(org_id=1, reports=FakeReports())
+
+
+def test_cached_report_reuses_closed_range(client: Any) -> None:
+    """Test a report for a closed date range is fetched once and read back unchanged."""
+    fetched = cached_report(client, "keywords", campaign_id=1, start_date=YESTERDAY, end_date=YESTERDAY)
+    cached = cached_report(client, "keywords", campaign_id=1, start_date=YESTERDAY, end_date=YESTERDAY)
+    assert client.reports.calls == 1
+    assert cached == fetched
+    (row,) = cached.row
+    assert row.metadata.bid_amount is not None
+    assert row.metadata.bid_amount.amount == "1.50"
+    assert row.total is not None
+    assert row.total.impressions == 120
+    assert row.granularity is not None
+    assert [g.impressions for g in row.granularity] == [70, 50]
+
+
+def test_cached_report_skips_ranges_including_today(client: Any) -> None:
+    """Test a report whose range includes today is never cached."""
+    for _ in range(2):
+        cached_report(client, "keywords", campaign_id=1, start_date=YESTERDAY, end_date=date.today())
+    assert client.reports.calls == 2
+
+
+def test_cached_report_expires_after_ttl(client: Any, tmp_path: Path) -> None:
+    """Test a cached report older than the TTL is fetched again and pruned."""
+    cached_report(client, "keywords", campaign_id=1, start_date=YESTERDAY, end_date=YESTERDAY)
+    (entry,) = (tmp_path / "reports").iterdir()
+    stale = entry.stat().st_mtime - utils.REPORT_CACHE_TTL - 1
+    os.utime(entry, (stale, stale))
+
+    cached_report(client, "keywords", campaign_id=1, start_date=YESTERDAY, end_date=YESTERDAY)
+    assert client.reports.calls == 2
+    assert entry.stat().st_mtime > stale
+
+
+def test_cached_report_refetches_corrupt_entry(client: Any, tmp_path: Path) -> None:
+    """Test an unreadable cache entry is replaced by a fresh report."""
+    cached_report(client, "keywords", campaign_id=1, start_date=YESTERDAY, end_date=YESTERDAY)
+    (entry,) = (tmp_path / "reports").iterdir()
+    entry.write_bytes(b"{not json")
+
+    report = cached_report(client, "keywords", campaign_id=1, start_date=YESTERDAY, end_date=YESTERDAY)
+    assert client.reports.calls == 2
+    assert ReportingResponse.model_validate_json(entry.read_bytes()) == report
+
+
+def test_cached_report_refresh_and_forget(client: Any) -> None:
+    """Test refresh bypasses the cache and forget_report drops the entry."""
+    params: dict[str, Any] = {"campaign_id": 1, "start_date": YESTERDAY, "end_date": YESTERDAY}
+    cached_report(client, "keywords", **params)
+    cached_report(client, "keywords", refresh=True, **params)
+    assert client.reports.calls == 2
+
+    utils.forget_report(client, "keywords", **params)
+    cached_report(client, "keywords", **params)
+    assert client.reports.calls == 3
+
+
+def test_print_csv_buffered(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test CSV written through stdout's byte buffer, including missing columns."""
+    print_csv([{"id": 1, "name": "a,b"}, {"id": 2}], ["id", "name"])
+    assert capsys.readouterr().out.splitlines() == ["id,name", '1,"a,b"', "2,"]
+
+
+def test_print_csv_text_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test CSV written to a text stream without a byte buffer."""
+    out = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out)
+    print_csv([{"name": "x"}, {"id": 3}], ["name"])
+    # csv quotes a lone empty field so the row isn't read back as blank
+    assert out.getvalue().splitlines() == ["name", "x", '""']
+
+
+def test_http_client_created_once_across_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test concurrent first requests share one HTTP client instead of each building a pool."""
+    created: list[object] = []
+
+    def slow_client(**_kwargs: Any) -> object:
+        time.sleep(0.01)
+        created.append(object())
+        return created[-1]
+
+    monkeypatch.setattr(utils.httpx, "Client", slow_client)
+    client = utils._CLIClient.__new__(utils._CLIClient)
+    client._http_client = None
+    client._timeout = 30.0
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: client._get_http_client(), range(8)))
+    assert len(created) == 1
+    assert all(result is created[0] for result in results)
+
+
+JSON_SAMPLE: dict[Any, Any] = {
+    "date": date(2024, 1, 2),
+    "updated": datetime(2024, 1, 2, 3, 4, 5),
+    "bid": Decimal("1.50"),
+    "name": 'Café ☕ 𝄞 "quoted" 0.00001',
+    "rates": [0.0523, 1.681239373972471e-05, 5e-07, 1e16, 0.0],
+    1: [{"nested": []}, {}],
+}
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_dump_json_matches_stdlib(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    """Test indented JSON is byte-for-byte json.dumps output, with or without orjson."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(utils, "orjson", None)
+    assert dump_json(JSON_SAMPLE, indent=True) == json.dumps(JSON_SAMPLE, indent=2, default=str).encode()